@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 
 import click
@@ -10,6 +11,18 @@ from lazy_github.ui.app import app
 _CLI_CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
+def _use_uvloop_if_available() -> None:
+    """
+    The UI is driven entirely by the asyncio event loop, so if uvloop happens to be installed then we use it for faster
+    scheduling. It's optional (and unavailable on Windows), so we fall back to the default loop without it.
+    """
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 @click.group(invoke_without_command=True, context_settings=_CLI_CONTEXT_SETTINGS)
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -30,6 +43,7 @@ def run(auth_backend: BackendType | None):
     if auth_backend:
         with Config.to_edit() as config:
             config.api.client_type = auth_backend
+    _use_uvloop_if_available()
     app.run()
 
 
@@ -17,6 +17,8 @@ X_MARK = "✘"
 BULLET_POINT = "•"
 
 NOTIFICATION_REFRESH_INTERVAL = 60
+NOTIFICATION_REFRESH_DEBOUNCE = 0.3
+REPO_SELECTION_DEBOUNCE = 0.15
 
 CONFIG_FOLDER = Path.home() / ".config/lazy-github"
 
@@ -63,6 +63,12 @@ class _LazyGithubContext:
                     raise TypeError(f"Invalid client type in config: {cls.client_type}")
         return cls._client
 
+    async def close_client(self) -> None:
+        """Closes the Github API client (if one was created), so that its connections aren't left open on exit"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     @property
     def current_directory_repo(cls) -> str | None:
         """The owner/name of the repo associated with the current working directory (if one exists)"""
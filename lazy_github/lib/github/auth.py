@@ -12,6 +12,10 @@ from lazy_github.lib.github.backends.protocol import BackendType
 _AUTHENTICATION_CACHE_LOCATION = CONFIG_FOLDER / "auth.text"
 _AUTH_TOKEN: Optional[str] = None
 
+# A successful `gh auth status` check is trusted for this many seconds before we shell out to check again
+_CLI_LOGIN_CHECK_TTL = 300
+_CLI_LOGIN_CONFIRMED_AT: Optional[float] = None
+
 
 @dataclass
 class DeviceCodeResponse:
@@ -102,18 +106,38 @@ def get_api_token() -> str:
     return _AUTH_TOKEN
 
 
-async def is_logged_in_to_cli() -> bool:
-    """Checks to see if the user is currently logged into the GitHub CLI"""
+async def is_logged_in_to_cli(force: bool = False) -> bool:
+    """
+    Checks to see if the user is currently logged into the GitHub CLI. Successful checks are reused for a few minutes
+    unless force=True. Failed checks are never reused, so that we notice as soon as the user logs in.
+    """
     # Avoiding circular imports
     from lazy_github.lib.github.backends.cli import run_gh_cli_command
     from lazy_github.lib.logging import lg
 
+    global _CLI_LOGIN_CONFIRMED_AT
+    if (
+        not force
+        and _CLI_LOGIN_CONFIRMED_AT is not None
+        and time.monotonic() - _CLI_LOGIN_CONFIRMED_AT < _CLI_LOGIN_CHECK_TTL
+    ):
+        return True
+
     try:
         result = await run_gh_cli_command(["auth", "status"])
-        return result.return_code == 0
+        logged_in = result.return_code == 0
     except Exception:
         lg.exception("Error checking if github CLI is authenticated")
-        return False
+        logged_in = False
+
+    _CLI_LOGIN_CONFIRMED_AT = time.monotonic() if logged_in else None
+    return logged_in
+
+
+def clear_cli_login_cache() -> None:
+    """Forgets the last successful CLI login check, so that the next check asks the gh CLI again"""
+    global _CLI_LOGIN_CONFIRMED_AT
+    _CLI_LOGIN_CONFIRMED_AT = None
 
 
 async def assert_is_logged_in() -> None:
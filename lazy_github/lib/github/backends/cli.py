@@ -4,7 +4,7 @@ import re
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from lazy_github.lib.config import Config
 from lazy_github.lib.constants import CONFIG_FOLDER, JSON_CONTENT_ACCEPT_TYPE
@@ -173,10 +173,19 @@ class GithubCliBackend(GithubApiBackend):
         command = build_command(url, headers=headers, body=json, method="PUT")
         return await run_gh_cli_command(command)
 
+    async def stream_text(self, url: str, headers: Headers | None = None) -> AsyncIterator[str]:
+        """gh only hands back output once the command exits, so the whole response comes through as one chunk"""
+        response = await self.get(url, headers=headers)
+        response.raise_for_status()
+        yield response.text
+
     async def get_user(self) -> User:
         response = await self.get("/user")
         return User(**response.json())
 
+    async def close(self) -> None:
+        """Every request is its own gh process, so there aren't any connections to close"""
+
     def github_headers(self, accept: str = JSON_CONTENT_ACCEPT_TYPE, cache_duration: int | None = None) -> Headers:
         """Helper function to build a request with specific headers"""
         max_age = cache_duration or self.config.cache.default_ttl
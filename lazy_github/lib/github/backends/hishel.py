@@ -1,7 +1,7 @@
-from typing import Any
+from typing import Any, AsyncIterator
 
 import hishel
-from httpx import HTTPStatusError, Response
+from httpx import HTTPStatusError, Limits, Response
 
 from lazy_github.lib.config import Config
 from lazy_github.lib.constants import JSON_CONTENT_ACCEPT_TYPE
@@ -14,6 +14,13 @@ from lazy_github.lib.github.backends.protocol import (
 )
 from lazy_github.models.github import User
 
+# Requests are bursty (opening a PR fetches its details, diff, checks and conversation at once), so keep pooled
+# connections around long enough that the next burst can reuse them rather than paying for new TLS handshakes
+_CONNECTION_LIMITS = Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60)
+
+# How many bytes of a streamed response to read at a time
+_STREAM_CHUNK_SIZE = 8192
+
 
 class HishelApiResponse(GithubApiResponse):
     def __init__(self, api_response: Response) -> None:
@@ -46,7 +53,9 @@ class HishelGithubApiBackend(GithubApiBackend):
         self.access_token = access_token
 
         storage = hishel.AsyncFileStorage(base_path=config.cache.cache_directory)
-        self.api_client = hishel.AsyncCacheClient(storage=storage, base_url=config.api.base_url)
+        self.api_client = hishel.AsyncCacheClient(
+            storage=storage, base_url=config.api.base_url, limits=_CONNECTION_LIMITS
+        )
 
     async def get(
         self,
@@ -57,6 +66,12 @@ class HishelGithubApiBackend(GithubApiBackend):
         response = await self.api_client.get(url, headers=headers, params=params, follow_redirects=True)
         return HishelApiResponse(response)
 
+    async def stream_text(self, url: str, headers: Headers | None = None) -> AsyncIterator[str]:
+        async with self.api_client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+            HishelApiResponse(response).raise_for_status()
+            async for text in response.aiter_text(_STREAM_CHUNK_SIZE):
+                yield text
+
     async def post(
         self,
         url: str,
@@ -96,3 +111,7 @@ class HishelGithubApiBackend(GithubApiBackend):
         """Returns the authed user for this client"""
         response = await self.api_client.get("/user", headers=self.github_headers())
         return User(**response.json())
+
+    async def close(self) -> None:
+        """Closes the pooled connections held by the underlying HTTP client"""
+        await self.api_client.aclose()
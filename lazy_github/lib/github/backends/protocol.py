@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Any, Mapping, Protocol
+from typing import Any, AsyncIterator, Mapping, Protocol
 
 from lazy_github.lib.constants import JSON_CONTENT_ACCEPT_TYPE
 from lazy_github.models.github import User
@@ -58,6 +58,10 @@ class GithubApiBackend(Protocol):
         json: dict[str, str] | None = None,
     ) -> GithubApiResponse: ...
 
+    def stream_text(self, url: str, headers: Headers | None = None) -> AsyncIterator[str]: ...
+
     async def get_user(self) -> User: ...
 
+    async def close(self) -> None: ...
+
     def github_headers(self, accept: str = JSON_CONTENT_ACCEPT_TYPE, cache_duration: int | None = None) -> Headers: ...
@@ -1,9 +1,8 @@
-from typing import Any
+from typing import Any, AsyncIterator
 
 from lazy_github.lib.config import Config
 from lazy_github.lib.constants import JSON_CONTENT_ACCEPT_TYPE
 from lazy_github.lib.github.backends.cli import GithubCliBackend
-from lazy_github.lib.github.backends.hishel import HishelGithubApiBackend
 from lazy_github.lib.github.backends.protocol import GithubApiBackend, Headers, QueryParams
 from lazy_github.models.github import User
 
@@ -21,6 +20,9 @@ class GithubClient(GithubApiBackend):
 
     @classmethod
     def hishel(cls, config: Config, access_token: str) -> "GithubClient":
+        # hishel is slow to import and only needed by the raw HTTP backend, so gh CLI users never pay for it
+        from lazy_github.lib.github.backends.hishel import HishelGithubApiBackend
+
         backend = HishelGithubApiBackend(config, access_token)
         return GithubClient(config, backend)
 
@@ -46,5 +48,11 @@ class GithubClient(GithubApiBackend):
     async def put(self, url: str, headers: Headers | None = None, json: dict[str, str] | None = None) -> Any:
         return await self.backend.put(url, headers, json)
 
+    def stream_text(self, url: str, headers: Headers | None = None) -> AsyncIterator[str]:
+        return self.backend.stream_text(url, headers)
+
     async def get_user(self) -> User:
         return await self.backend.get_user()
+
+    async def close(self) -> None:
+        await self.backend.close()
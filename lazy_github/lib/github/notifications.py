@@ -1,16 +1,39 @@
+import asyncio
 import json
 import re
+import time
+from typing import AsyncIterator, Callable
 
 from lazy_github.lib.context import LazyGithubContext, github_headers
+from lazy_github.lib.github.auth import clear_cli_login_cache
 from lazy_github.lib.github.backends.cli import build_command, run_gh_cli_command
 from lazy_github.lib.github.pull_requests import get_full_pull_request
 from lazy_github.lib.logging import lg
 from lazy_github.models.github import FullPullRequest, Notification, NotificationSubject
 
 NOTIFICATIONS_PAGE_COUNT = 50
+NOTIFICATION_PAGES_TO_STREAM = 5
+NOTIFICATION_READ_BATCH_DELAY = 0.1
+NOTIFICATION_READ_BATCH_SIZE = 20
+NOTIFICATION_READ_MAX_CONCURRENCY = 10
+UNREAD_NOTIFICATION_COUNT_TTL = 30
 
 _PULL_REQUEST_URL_REGEX = re.compile(r"[^:]+:[\/]+[^\/]+\/repos\/([^\/]+)\/([^\/]+)\/pulls\/(\d+)")
 
+# Shared across every batch so that overlapping flushes can't exceed Github's secondary rate limits between them
+_MARK_READ_SEMAPHORE = asyncio.Semaphore(NOTIFICATION_READ_MAX_CONCURRENCY)
+
+# The last unread count we fetched and when we fetched it, along with the Last-Modified header Github sent alongside it
+_UNREAD_COUNT_CACHE: tuple[float, int] | None = None
+_UNREAD_COUNT_LAST_MODIFIED: str | None = None
+
+
+def clear_unread_notification_count_cache() -> None:
+    """Forgets the last unread notification count, so that the next lookup fetches it from Github again"""
+    global _UNREAD_COUNT_CACHE, _UNREAD_COUNT_LAST_MODIFIED
+    _UNREAD_COUNT_CACHE = None
+    _UNREAD_COUNT_LAST_MODIFIED = None
+
 
 async def fetch_notifications(all: bool, per_page: int = NOTIFICATIONS_PAGE_COUNT, page: int = 1) -> list[Notification]:
     """Fetches notifications on GitHub. If all=True, then previously read notifications will also be returned"""
@@ -27,16 +50,147 @@ async def fetch_notifications(all: bool, per_page: int = NOTIFICATIONS_PAGE_COUN
     return notifications
 
 
-async def mark_notification_as_read(notification: Notification) -> None:
+async def fetch_notifications_pages(
+    all: bool, per_page: int = NOTIFICATIONS_PAGE_COUNT, max_pages: int = NOTIFICATION_PAGES_TO_STREAM
+) -> AsyncIterator[list[Notification]]:
+    """Fetches notifications on GitHub one page at a time, yielding each page as soon as it has been retrieved"""
+    for page in range(1, max_pages + 1):
+        notifications = await fetch_notifications(all, per_page, page)
+        if notifications:
+            yield notifications
+        if len(notifications) < per_page:
+            break
+
+
+async def mark_notification_as_read(notification: Notification) -> bool:
+    """Marks the specified notification as read, returning whether or not the request was successful"""
     try:
-        await run_gh_cli_command(["--method", "PATCH", "api", f"/notifications/threads/{notification.id}"])
+        result = await run_gh_cli_command(["--method", "PATCH", "api", f"/notifications/threads/{notification.id}"])
     except Exception:
         lg.exception("Failed to mark notification as read")
+        return False
+
+    if result.is_success():
+        clear_unread_notification_count_cache()
+        return True
+    return False
+
+
+async def mark_notifications_as_read(notifications: list[Notification]) -> list[bool]:
+    """
+    Marks each of the specified notifications as read. Github doesn't offer an endpoint for marking a specific set of
+    threads as read, so the requests are sent concurrently (up to a limit). The success of each request is returned in
+    order.
+    """
+
+    async def _mark_as_read(notification: Notification) -> bool:
+        async with _MARK_READ_SEMAPHORE:
+            return await mark_notification_as_read(notification)
+
+    return list(await asyncio.gather(*[_mark_as_read(n) for n in notifications]))
+
+
+class NotificationReadBatcher:
+    """
+    Buffers notifications that are being marked as read so that a burst of them is sent to Github together rather than
+    one request at a time. Buffered notifications are flushed after a short delay without any new notifications or as
+    soon as the buffer is full.
+    """
 
+    def __init__(
+        self,
+        on_failure: Callable[[list[Notification]], None],
+        flush_delay: float = NOTIFICATION_READ_BATCH_DELAY,
+        max_batch_size: int = NOTIFICATION_READ_BATCH_SIZE,
+    ) -> None:
+        self.on_failure = on_failure
+        self.flush_delay = flush_delay
+        self.max_batch_size = max_batch_size
+        self._pending: dict[int, Notification] = {}
+        self._delayed_flush: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    def enqueue(self, notification: Notification) -> None:
+        """Adds a notification to the next batch that will be marked as read"""
+        self._pending[notification.id] = notification
+        if len(self._pending) >= self.max_batch_size:
+            self.flush_now()
+        else:
+            self._cancel_delayed_flush()
+            self._delayed_flush = asyncio.create_task(self._flush_after_delay())
+
+    def flush_now(self) -> None:
+        """Immediately sends any buffered notifications to Github"""
+        self._cancel_delayed_flush()
+        if not self._pending:
+            return
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        task = asyncio.create_task(self._flush(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    def _cancel_delayed_flush(self) -> None:
+        if self._delayed_flush is not None:
+            self._delayed_flush.cancel()
+            self._delayed_flush = None
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.flush_delay)
+        self._delayed_flush = None
+        self.flush_now()
+
+    async def _flush(self, batch: list[Notification]) -> None:
+        lg.debug(f"Marking {len(batch)} notification(s) as read")
+        results = await mark_notifications_as_read(batch)
+        if failed := [n for n, succeeded in zip(batch, results) if not succeeded]:
+            self.on_failure(failed)
+
+
+async def unread_notification_count(force: bool = False) -> int:
+    """
+    Returns the number of currently unread notifications on GitHub. A recently fetched count is reused unless force=True
+    """
+    global _UNREAD_COUNT_CACHE, _UNREAD_COUNT_LAST_MODIFIED
+    if not force and _UNREAD_COUNT_CACHE is not None:
+        fetched_at, count = _UNREAD_COUNT_CACHE
+        if time.monotonic() - fetched_at < UNREAD_NOTIFICATION_COUNT_TTL:
+            return count
+
+    # Once the cached count expires, we ask Github whether anything has changed since we last counted. If nothing has,
+    # it responds with a 304 and no body. Marking notifications as read doesn't necessarily change Last-Modified, so
+    # forced refreshes always fetch the full list.
+    headers: dict[str, str] = {}
+    if not force and _UNREAD_COUNT_CACHE is not None and _UNREAD_COUNT_LAST_MODIFIED:
+        headers["If-Modified-Since"] = _UNREAD_COUNT_LAST_MODIFIED
+
+    count = 0
+    query_params = {"all": "false", "page": 1, "per_page": NOTIFICATIONS_PAGE_COUNT}
+    try:
+        result = await run_gh_cli_command(build_command("/notifications", headers=headers, query_params=query_params))
+        if result.http_status == 304 and _UNREAD_COUNT_CACHE is not None:
+            _, count = _UNREAD_COUNT_CACHE
+        else:
+            notifications = json.loads(result.stdout) if result.is_success() and result.stdout else []
+            if not (result.is_success() and isinstance(notifications, list)):
+                # An error body (such as a 401 or rate limit response) isn't a list of notifications, so we keep
+                # whatever we last counted rather than caching a bogus count
+                lg.error(f"Failed to retrieve unread notification count (HTTP {result.http_status}): {result.stderr}")
+                return _UNREAD_COUNT_CACHE[1] if _UNREAD_COUNT_CACHE is not None else 0
+
+            count = len(notifications)
+            last_modified = result.headers.get("Last-Modified") or result.headers.get("last-modified")
+            _UNREAD_COUNT_LAST_MODIFIED = last_modified.strip() if last_modified else None
+    except Exception:
+        lg.exception("Failed to retrieve unread notification count from the Github API")
+        # Don't hold on to a count we failed to fetch, and make sure the next refresh checks we're still logged in
+        clear_unread_notification_count_cache()
+        clear_cli_login_cache()
+        return count
 
-async def unread_notification_count() -> int:
-    """Returns the number of currently unread notifications on GitHub"""
-    return len(await fetch_notifications(all=False))
+    _UNREAD_COUNT_CACHE = (time.monotonic(), count)
+    return count
 
 
 async def extract_notification_subject(subject: NotificationSubject) -> FullPullRequest | None:
@@ -57,3 +211,4 @@ async def mark_all_notifications_as_read() -> None:
     """Marks all of the current user's notifications as read"""
     result = await LazyGithubContext.client.put("/notifications", headers=github_headers(), json={"read": "true"})
     result.raise_for_status()
+    clear_unread_notification_count_cache()
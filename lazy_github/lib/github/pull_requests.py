@@ -1,3 +1,8 @@
+from asyncio import Future, create_task, get_running_loop, shield
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Coroutine, Hashable, TypeVar
+
 from lazy_github.lib.config import MergeMethod
 from lazy_github.lib.constants import DIFF_CONTENT_ACCEPT_TYPE
 from lazy_github.lib.context import LazyGithubContext, github_headers
@@ -14,6 +19,47 @@ from lazy_github.models.github import (
     ReviewComment,
 )
 
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# How many full pull requests to keep around, keyed by the repo's full name, PR number and when the PR was last updated
+_FULL_PULL_REQUEST_CACHE_SIZE = 64
+_FULL_PULL_REQUESTS: dict[tuple[str, int, datetime], Future[FullPullRequest]] = {}
+
+# Diffs can be large, so we only hold on to the handful most recently viewed. They're keyed by the repo, PR number and
+# the head/base commits, since the diff can't change without one of those changing too.
+_DIFF_CACHE_SIZE = 8
+_DIFFS: dict[tuple[str, int, str, str], Future[str]] = {}
+
+
+def _evict_if_failed(cache: dict[K, Future[T]], key: K, task: Future[T]) -> None:
+    if (task.cancelled() or task.exception() is not None) and cache.get(key) is task:
+        del cache[key]
+
+
+def _cache_future(cache: dict[K, Future[T]], max_size: int, key: K, future: Future[T]) -> None:
+    cache[key] = future
+    if len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+
+def _shared_fetch(
+    cache: dict[K, Future[T]], max_size: int, key: K, fetch: Callable[[], Coroutine[Any, Any, T]]
+) -> Future[T]:
+    """
+    Returns the result of the fetch cached under the key, starting the fetch if it isn't already cached. Concurrent
+    lookups of the same key share the same request and failed fetches are never cached.
+    """
+    if (task := cache.get(key)) is None:
+        task = create_task(fetch())
+        task.add_done_callback(partial(_evict_if_failed, cache, key))
+        _cache_future(cache, max_size, key, task)
+    else:
+        # Move the key to the end so that the least recently used entry is the first to be evicted
+        cache[key] = cache.pop(key)
+    # Shielded so that a caller giving up on the fetch doesn't cancel it for anybody else waiting on it
+    return shield(task)
+
 
 async def list_for_repo(repo: Repository) -> list[PartialPullRequest]:
     """Lists the pull requests associated with the specified repo"""
@@ -41,16 +87,79 @@ async def create_pull_request(
     return FullPullRequest(**response.json(), repo=repo)
 
 
-async def get_full_pull_request(repo: Repository, pr_number: int) -> FullPullRequest:
-    """Converts a partial pull request into a full pull request"""
+async def _fetch_full_pull_request(repo: Repository, pr_number: int) -> FullPullRequest:
     url = f"/repos/{repo.owner.login}/{repo.name}/pulls/{pr_number}"
     response = await LazyGithubContext.client.get(url, headers=github_headers())
     response.raise_for_status()
     return FullPullRequest(**response.json(), repo=repo)
 
 
+def _replace_cached_full_pull_request(repo: Repository, full_pr: FullPullRequest) -> None:
+    """
+    Drops every cached copy of the PR in favor of a freshly fetched one. Rows in the UI hold on to the updated_at from
+    when they were listed, so selecting them again will fetch the PR rather than getting the stale copy back.
+    """
+    stale_keys = [key for key in _FULL_PULL_REQUESTS if key[0] == repo.full_name and key[1] == full_pr.number]
+    for key in stale_keys:
+        del _FULL_PULL_REQUESTS[key]
+
+    fresh: Future[FullPullRequest] = get_running_loop().create_future()
+    fresh.set_result(full_pr)
+    _cache_future(
+        _FULL_PULL_REQUESTS, _FULL_PULL_REQUEST_CACHE_SIZE, (repo.full_name, full_pr.number, full_pr.updated_at), fresh
+    )
+
+
+async def get_full_pull_request(
+    repo: Repository, pr_number: int, updated_at: datetime | None = None
+) -> FullPullRequest:
+    """
+    Converts a partial pull request into a full pull request. If the time the PR was last updated is known, then the
+    result is cached against it and concurrent lookups of the same PR share a single request. Otherwise, the PR is
+    always fetched and replaces anything cached for it.
+    """
+    if updated_at is None:
+        full_pr = await _fetch_full_pull_request(repo, pr_number)
+        _replace_cached_full_pull_request(repo, full_pr)
+        return full_pr
+
+    key = (repo.full_name, pr_number, updated_at)
+    fetch = partial(_fetch_full_pull_request, repo, pr_number)
+    return await _shared_fetch(_FULL_PULL_REQUESTS, _FULL_PULL_REQUEST_CACHE_SIZE, key, fetch)
+
+
+def _diff_cache_key(pr: FullPullRequest) -> tuple[str, int, str, str]:
+    return (pr.repo.full_name, pr.number, pr.head.sha, pr.base.sha)
+
+
 async def get_diff(pr: FullPullRequest) -> str:
-    """Fetches the raw diff for an individual pull request"""
+    """Fetches the raw diff for an individual pull request, reusing it if the PR was viewed recently"""
+    return await _shared_fetch(_DIFFS, _DIFF_CACHE_SIZE, _diff_cache_key(pr), partial(_fetch_diff, pr))
+
+
+async def stream_diff(pr: FullPullRequest) -> AsyncGenerator[str, None]:
+    """
+    Yields the raw diff for a pull request a piece at a time as it downloads, so that large diffs can be displayed
+    before they've been fully fetched. The gh CLI can't stream its output, so it yields the entire diff at once.
+    """
+    key = _diff_cache_key(pr)
+    if key in _DIFFS or LazyGithubContext.client_type != BackendType.RAW_HTTP:
+        yield await get_diff(pr)
+        return
+
+    chunks: list[str] = []
+    headers = github_headers(DIFF_CONTENT_ACCEPT_TYPE)
+    async for chunk in LazyGithubContext.client.stream_text(pr.diff_url, headers=headers):
+        chunks.append(chunk)
+        yield chunk
+
+    # Only a diff that was read in full gets cached, so that it's reused if the PR is opened again
+    diff: Future[str] = get_running_loop().create_future()
+    diff.set_result("".join(chunks))
+    _cache_future(_DIFFS, _DIFF_CACHE_SIZE, key, diff)
+
+
+async def _fetch_diff(pr: FullPullRequest) -> str:
     match LazyGithubContext.client_type:
         case BackendType.GITHUB_CLI:
             response = await run_gh_cli_command(["pr", "diff", "-R", pr.repo.full_name, str(pr.number)])
@@ -1,3 +1,5 @@
+import asyncio
+import re
 from functools import partial
 from typing import Literal
 
@@ -11,6 +13,21 @@ RepositorySortKey = Literal["created"] | Literal["updated"] | Literal["pushed"]
 
 # This would be 2500 repos with default page size, calm down
 MAX_PAGES = 30
+# How many pages of repositories we'll request at once. With the gh CLI backend, each request is a separate process.
+MAX_CONCURRENT_PAGE_REQUESTS = 5
+
+_PAGE_QUERY_PARAM_REGEX = re.compile(r"[?&]page=(\d+)")
+
+# Shared between listings so that overlapping refreshes don't exceed the limit between them
+_PAGE_REQUEST_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_PAGE_REQUESTS)
+
+
+def _last_page_from_link_header(link_header: str | None, current_page: int) -> int:
+    """Determines the last available page from the pagination links in the Github API link header"""
+    for link in (link_header or "").split(","):
+        if 'rel="last"' in link and (matches := _PAGE_QUERY_PARAM_REGEX.search(link)):
+            return int(matches.group(1))
+    return current_page
 
 
 async def _list_for_page(
@@ -19,18 +36,18 @@ async def _list_for_page(
     direction: SortDirection,
     per_page: int,
     page: int,
-) -> tuple[list[Repository], bool]:
-    """Retrieves a single page of Github repos matching the specified criteria"""
+) -> tuple[list[Repository], int]:
+    """Retrieves a single page of Github repos matching the specified criteria, along with the last available page"""
     headers = github_headers(cache_duration=LazyGithubContext.config.cache.list_repos_ttl)
     query_params = {"type": repo_types, "direction": direction, "sort": sort, "page": page, "per_page": per_page}
 
     response = await LazyGithubContext.client.get("/user/repos", headers=headers, params=query_params)
     response.raise_for_status()
 
-    link_header = response.headers.get("link")
-    more_pages_remaining = bool(link_header) and 'rel="next"' in link_header
+    link_header = response.headers.get("link") or response.headers.get("Link")
+    last_page = _last_page_from_link_header(link_header, page)
 
-    return [Repository(**r) for r in response.json()], more_pages_remaining
+    return [Repository(**r) for r in response.json()], last_page
 
 
 async def _list(
@@ -40,13 +57,17 @@ async def _list(
     per_page: int = 50,
 ) -> list[Repository]:
     "Pulls all of the repositories associated with a user and handles pagination"
-    repositories: list[Repository] = []
 
-    for page in range(1, MAX_PAGES):
-        repos_in_page, more_pages = await _list_for_page(repo_types, sort, direction, per_page, page)
+    async def _list_page(page: int) -> tuple[list[Repository], int]:
+        async with _PAGE_REQUEST_SEMAPHORE:
+            return await _list_for_page(repo_types, sort, direction, per_page, page)
+
+    repositories, last_page = await _list_page(1)
+
+    # Once we know how many pages there are, the rest of them can be fetched concurrently (up to a limit)
+    remaining_pages = await asyncio.gather(*[_list_page(page) for page in range(2, min(last_page, MAX_PAGES) + 1)])
+    for repos_in_page, _ in remaining_pages:
         repositories.extend(repos_in_page)
-        if not more_pages:
-            break
 
     return repositories
 
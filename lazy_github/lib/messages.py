@@ -1,5 +1,3 @@
-from functools import cached_property
-
 from textual.message import Message
 
 from lazy_github.models.github import (
@@ -18,21 +16,24 @@ class RepoSelected(Message):
     A message indicating that a particular user repo has been selected.
 
     This message is used to trigger follow-up contextual actions based on the selected repo, such as loading pull
-    requests, issues, actions, etc.
+    requests, issues, actions, etc. If force is set, then the repo is reloaded even if it's already the current repo.
     """
 
-    def __init__(self, repo: Repository) -> None:
+    def __init__(self, repo: Repository, force: bool = False) -> None:
         self.repo = repo
+        self.force = force
         super().__init__()
 
 
 class PullRequestSelected(Message):
     """
-    A message indicating that the user is looking for additional information on a particular pull request.
+    A message indicating that the user is looking for additional information on a particular pull request. If force is
+    set, then the PR's details are refetched even if they're already being displayed.
     """
 
-    def __init__(self, pr: PartialPullRequest) -> None:
+    def __init__(self, pr: PartialPullRequest, force: bool = False) -> None:
         self.pr = pr
+        self.force = force
         super().__init__()
 
 
@@ -46,30 +47,6 @@ class IssueSelected(Message):
         super().__init__()
 
 
-class IssuesAndPullRequestsFetched(Message):
-    """
-    Since issues and pull requests are both represented on the Github API as issues, we want to pull issues once and
-    then send that message to both sections of the UI.
-    """
-
-    def __init__(self, repo: Repository, issues_and_pull_requests: list[Issue]) -> None:
-        self.repo = repo
-        self.issues_and_pull_requests = issues_and_pull_requests
-        super().__init__()
-
-    @cached_property
-    def pull_requests(self) -> list[PartialPullRequest]:
-        return [pr for pr in self.issues_and_pull_requests if isinstance(pr, PartialPullRequest)]
-
-    @cached_property
-    def issues(self) -> list[Issue]:
-        return [
-            issue
-            for issue in self.issues_and_pull_requests
-            if isinstance(issue, Issue) and not isinstance(issue, PartialPullRequest)
-        ]
-
-
 class PullRequestCreated(Message):
     def __init__(self, pull_request: FullPullRequest) -> None:
         super().__init__()
@@ -115,6 +115,9 @@ class LazyGithub(App):
         self.theme = LazyGithubContext.config.appearance.theme.name
         self.set_keymap(LazyGithubContext.config.bindings.overrides)
 
+    async def on_unmount(self) -> None:
+        await LazyGithubContext.close_client()
+
     def action_maximize(self) -> None:
         if self.screen.is_maximized:
             return
@@ -2,7 +2,7 @@ from textual import on, suggester, validation, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, VerticalScroll
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Label, Markdown, Rule, Switch, TextArea
+from textual.widgets import Button, Input, Label, Rule, Switch, TextArea
 
 from lazy_github.lib.bindings import LazyGithubBindings
 from lazy_github.lib.context import LazyGithubContext
@@ -10,7 +10,9 @@ from lazy_github.lib.github.branches import list_branches
 from lazy_github.lib.github.pull_requests import create_pull_request
 from lazy_github.lib.logging import lg
 from lazy_github.lib.messages import BranchesLoaded, PullRequestCreated
-from lazy_github.models.github import Branch, FullPullRequest
+from lazy_github.models.github import Branch, FullPullRequest, Repository
+
+_NON_EMPTY = validation.Length(minimum=1)
 
 
 class BranchSelection(Horizontal):
@@ -29,22 +31,21 @@ class BranchSelection(Horizontal):
     }
     """
 
-    def __init__(self) -> None:
+    def __init__(self, repo: Repository) -> None:
         super().__init__()
+        self._repo = repo
         self.branches: dict[str, Branch] = {}
 
     def compose(self) -> ComposeResult:
-        assert LazyGithubContext.current_repo is not None, "Unexpectedly missing current repo in new PR modal"
-        non_empty_validator = validation.Length(minimum=1)
         yield Label("[bold]Base[/bold]")
         yield Input(
             id="base_ref",
             placeholder="Choose a base ref",
-            value=LazyGithubContext.current_repo.default_branch,
-            validators=[non_empty_validator],
+            value=self._repo.default_branch,
+            validators=[_NON_EMPTY],
         )
         yield Label(":left_arrow: [bold]Compare[/bold]")
-        yield Input(id="head_ref", placeholder="Choose a head ref", validators=[non_empty_validator])
+        yield Input(id="head_ref", placeholder="Choose a head ref", validators=[_NON_EMPTY])
         yield Label("Draft")
         yield Switch(id="pr_is_draft", value=False)
 
@@ -66,11 +67,7 @@ class BranchSelection(Horizontal):
 
     @work
     async def set_default_branch_value(self) -> None:
-        if (
-            LazyGithubContext.current_directory_repo
-            and LazyGithubContext.current_repo
-            and LazyGithubContext.current_directory_repo == LazyGithubContext.current_repo.full_name
-        ):
+        if LazyGithubContext.current_directory_repo == self._repo.full_name:
             self.query_one("#head_ref", Input).value = LazyGithubContext.current_directory_branch or ""
 
     async def on_mount(self) -> None:
@@ -86,11 +83,7 @@ class BranchSelection(Horizontal):
 
     @work
     async def fetch_branches(self) -> None:
-        # This shouldn't happen since the current repo needs to be set to open this modal, but we'll validate it to
-        # make sure
-        assert LazyGithubContext.current_repo is not None, "Current repo unexpectedly missing in new PR modal"
-
-        branches = await list_branches(LazyGithubContext.current_repo)
+        branches = await list_branches(self._repo)
         self.post_message(BranchesLoaded(branches))
 
 
@@ -129,15 +122,28 @@ class NewPullRequestContainer(VerticalScroll):
     #pr_title {
         margin-bottom: 1;
     }
+
+    .header {
+        width: 100%;
+        content-align: center middle;
+        margin-bottom: 1;
+    }
     """
     BINDINGS = [LazyGithubBindings.SUBMIT_DIALOG]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # The current repo needs to be set to open this modal, so we capture it once up front
+        if LazyGithubContext.current_repo is None:
+            raise ValueError("A repository must be selected before creating a new pull request")
+        self._repo = LazyGithubContext.current_repo
+
     def compose(self) -> ComposeResult:
-        yield Markdown("# New Pull Request")
-        yield BranchSelection()
+        yield Label("[b]New Pull Request[/b]", classes="header")
+        yield BranchSelection(self._repo)
         yield Rule()
         yield Label("[bold]Pull Request Title[/bold]")
-        yield Input(id="pr_title", placeholder="Title", validators=[validation.Length(minimum=1)])
+        yield Input(id="pr_title", placeholder="Title", validators=[_NON_EMPTY])
         yield Label("[bold]Pull Request Description[/bold]")
         yield TextArea.code_editor(id="pr_description", soft_wrap=True)
         yield NewPullRequestButtons()
@@ -147,24 +153,24 @@ class NewPullRequestContainer(VerticalScroll):
         self.app.pop_screen()
 
     async def _create_pr(self) -> None:
-        assert LazyGithubContext.current_repo is not None, "Unexpectedly missing current repo in new PR modal"
         title_field = self.query_one("#pr_title", Input)
-        title_field.validate(title_field.value)
         description_field = self.query_one("#pr_description", TextArea)
         head_ref_field = self.query_one("#head_ref", Input)
-        head_ref_field.validate(head_ref_field.value)
         base_ref_field = self.query_one("#base_ref", Input)
-        base_ref_field.validate(base_ref_field.value)
         draft_field = self.query_one("#pr_is_draft", Switch)
 
-        if not (title_field.is_valid and head_ref_field.is_valid and base_ref_field.is_valid):
+        fields = (title_field, head_ref_field, base_ref_field)
+        # Every field is validated up front so that all of the invalid ones are highlighted, not just the first
+        for field in fields:
+            field.validate(field.value)
+        if not all(f.is_valid for f in fields):
             self.notify("Missing required fields!", title="Invalid PR!", severity="error")
             return
 
         self.notify("Creating new pull request...")
         try:
             created_pr = await create_pull_request(
-                LazyGithubContext.current_repo,
+                self._repo,
                 title_field.value,
                 description_field.text,
                 base_ref_field.value,
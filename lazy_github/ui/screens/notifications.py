@@ -1,33 +1,74 @@
+import sys
+from datetime import datetime
+
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, ScrollableContainer
-from textual.coordinate import Coordinate
 from textual.screen import ModalScreen
-from textual.widgets import DataTable, Markdown, TabbedContent, TabPane
-from textual.widgets.data_table import RowDoesNotExist
+from textual.widgets import DataTable, Label, TabbedContent, TabPane
 
 from lazy_github.lib.bindings import LazyGithubBindings
 from lazy_github.lib.constants import BULLET_POINT, CHECKMARK
 from lazy_github.lib.context import LazyGithubContext
 from lazy_github.lib.github.notifications import (
     NOTIFICATIONS_PAGE_COUNT,
+    NotificationReadBatcher,
     fetch_notifications,
+    fetch_notifications_pages,
     mark_all_notifications_as_read,
     mark_notification_as_read,
 )
+from lazy_github.lib.logging import lg
 from lazy_github.lib.messages import AllNotificationsMarkedAsRead, NotificationMarkedAsRead, NotificationSelected
 from lazy_github.models.github import Notification
 from lazy_github.ui.widgets.common import LazilyLoadedDataTable, LazyGithubFooter, TableRow
 
+# Rows are rebuilt whenever notifications move between tabs or the tables are searched, so we hold onto the formatted
+# row for each notification until that notification is updated or the notification tables are closed
+_NOTIFICATION_ROWS: dict[int, tuple[datetime, TableRow]] = {}
+
+
+# The reasons Github documents for notifications, formatted ahead of time so every row shares the same strings
+_REASON_DISPLAY = {
+    reason: sys.intern(reason.replace("_", " ").title())
+    for reason in (
+        "approval_requested",
+        "assign",
+        "author",
+        "ci_activity",
+        "comment",
+        "invitation",
+        "manual",
+        "member_feature_requested",
+        "mention",
+        "review_requested",
+        "security_advisory_credit",
+        "security_alert",
+        "state_change",
+        "subscribed",
+        "team_mention",
+    )
+}
+
+
+def _format_reason(reason: str) -> str:
+    return _REASON_DISPLAY.get(reason) or sys.intern(reason.replace("_", " ").title())
+
 
 def notification_to_row(notification: Notification) -> TableRow:
-    return (
+    cached = _NOTIFICATION_ROWS.get(notification.id)
+    if cached is not None and cached[0] == notification.updated_at:
+        return cached[1]
+
+    row: TableRow = (
         notification.updated_at.replace(tzinfo=None),
-        notification.subject.subject_type,
+        sys.intern(notification.subject.subject_type),
         notification.subject.title.strip(),
-        notification.reason.replace("_", " ").title(),
+        _format_reason(notification.reason),
         notification.id,
     )
+    _NOTIFICATION_ROWS[notification.id] = (notification.updated_at, row)
+    return row
 
 
 class _NotificationsTableTabPane(TabPane):
@@ -44,22 +85,22 @@ class _NotificationsTableTabPane(TabPane):
             repo_based_cache=False,
             load_function=None,
             batch_size=NOTIFICATIONS_PAGE_COUNT,
+            prefetch_next_batch=True,
         )
 
     def compose(self) -> ComposeResult:
         yield self.searchable_table
 
-    def remove_notification(self, notification: Notification) -> None:
-        self.searchable_table.table.remove_row(row_key=str(notification.id))
+    def has_row(self, row_key: str) -> bool:
+        return row_key in self.searchable_table.table.rows
 
     def get_selected_notification(self) -> Notification:
-        current_row = self.searchable_table.table.cursor_row
-        id = self.searchable_table.table.get_cell_at(Coordinate(current_row, self.id_column))
-        return self.searchable_table.items[str(id)]
+        return self.searchable_table.get_selected_item()
 
     @on(DataTable.RowSelected)
-    def notification_selected(self) -> None:
-        notification = self.get_selected_notification()
+    def notification_selected(self, row_selected: DataTable.RowSelected) -> None:
+        # The selection event already carries the key of the selected row, so there's no need to resolve the cursor
+        notification = self.searchable_table.items[str(row_selected.row_key.value)]
         self.post_message(NotificationSelected(notification))
 
     def on_mount(self) -> None:
@@ -71,8 +112,6 @@ class _NotificationsTableTabPane(TabPane):
         self.searchable_table.table.add_column("Reason", key="reason")
         self.searchable_table.table.add_column("Thread ID", key="id")
 
-        self.id_column = self.searchable_table.table.get_column_index("id")
-
 
 class ReadNotificationTabPane(_NotificationsTableTabPane):
     def __init__(self) -> None:
@@ -86,11 +125,7 @@ class UnreadNotificationTabPane(_NotificationsTableTabPane):
         super().__init__(id="unread", prefix="unread", title=f"[red]{BULLET_POINT}Unread[/red]")
 
     async def action_mark_read(self) -> None:
-        current_row = self.searchable_table.table.cursor_row
-        id_coord = Coordinate(current_row, self.id_column)
-        id = self.searchable_table.table.get_cell_at(id_coord)
-        notification_to_mark = self.searchable_table.items[str(id)]
-
+        notification_to_mark = self.get_selected_notification()
         self.post_message(NotificationMarkedAsRead(notification_to_mark))
 
     async def action_mark_all_read(self) -> None:
@@ -103,6 +138,12 @@ class NotificationsContainer(Container):
         max-height: 80%;
         align: center middle;
     }
+
+    .header {
+        width: 100%;
+        content-align: center middle;
+        margin: 1 0;
+    }
     """
 
     BINDINGS = [LazyGithubBindings.VIEW_READ_NOTIFICATIONS, LazyGithubBindings.VIEW_UNREAD_NOTIFICATIONS]
@@ -111,13 +152,22 @@ class NotificationsContainer(Container):
         super().__init__(*args, **kwargs)
         self.unread_tab = UnreadNotificationTabPane()
         self.read_tab = ReadNotificationTabPane()
+        self.tabs = TabbedContent()
         self.unread_tab.searchable_table.change_load_function(self.load_more_unread_notifications)
         self.read_tab.searchable_table.change_load_function(self.load_more_read_notifications)
+        self.read_batcher = NotificationReadBatcher(self.revert_notifications_marked_read)
+        # Notifications read since the modal opened, which shouldn't reappear when later unread pages are loaded
+        self._read_locally: set[int] = set()
+        self.unread_tab.searchable_table.item_filter = self._is_still_unread
+
+        # Read notifications aren't added to the read tab until the user actually looks at it
+        self._pending_read: list[Notification] = []
+        self._read_tab_populated = False
 
     def compose(self) -> ComposeResult:
-        yield Markdown("# Notifications")
+        yield Label("[b]Notifications[/b]", classes="header")
         with ScrollableContainer():
-            with TabbedContent():
+            with self.tabs:
                 yield self.unread_tab
                 yield self.read_tab
 
@@ -125,29 +175,62 @@ class NotificationsContainer(Container):
     async def all_notifications_marked_as_read(self, _: NotificationMarkedAsRead) -> None:
         await mark_all_notifications_as_read()
         self.notify("Marked all notifications as read")
-        try:
-            for notification in self.unread_tab.searchable_table.items.values():
-                self.read_tab.searchable_table.add_item(notification)
-            self.unread_tab.searchable_table.clear_rows()
-            self.action_view_read()
-        except RowDoesNotExist:
-            pass
+        # We're about to switch to the read tab anyway, so populate it first and then move everything over at once
+        self._populate_read_tab()
+        self.read_tab.searchable_table.bulk_transfer_from(self.unread_tab.searchable_table)
+        # Everything is read now, so there aren't any more unread pages to load
+        self.unread_tab.searchable_table.cancel_prefetched_batches()
+        self.unread_tab.searchable_table.can_load_more = False
+        self.action_view_read()
 
     @on(NotificationMarkedAsRead)
-    async def notification_marked_read(self, message: NotificationMarkedAsRead) -> None:
-        await mark_notification_as_read(message.notification)
-        try:
-            self.unread_tab.remove_notification(message.notification)
-            self.read_tab.searchable_table.add_item(message.notification)
-        except RowDoesNotExist:
-            pass
+    def notification_marked_read(self, message: NotificationMarkedAsRead) -> None:
+        # Optimistically move the notification over to the read tab and only move it back if the API call fails
+        self._read_locally.add(message.notification.id)
+        if self.unread_tab.has_row(str(message.notification.id)):
+            self.unread_tab.searchable_table.move_item_to(self.read_tab.searchable_table, message.notification)
+        self.read_batcher.enqueue(message.notification)
+
+    def revert_notifications_marked_read(self, notifications: list[Notification]) -> None:
+        """Moves notifications that we failed to mark as read on Github back into the unread tab"""
+        for notification in notifications:
+            self._read_locally.discard(notification.id)
+            if self.read_tab.has_row(str(notification.id)):
+                self.read_tab.searchable_table.move_item_to(self.unread_tab.searchable_table, notification)
+        self.notify(
+            f"Could not mark {len(notifications)} notification(s) as read",
+            title="Error Updating Notifications",
+            severity="error",
+        )
+
+    def _is_still_unread(self, notification: Notification) -> bool:
+        return notification.unread and notification.id not in self._read_locally
+
+    def _add_read_notifications(self, notifications: list[Notification]) -> None:
+        if self._read_tab_populated:
+            self.read_tab.searchable_table.add_items(notifications)
+        else:
+            self._pending_read.extend(notifications)
+
+    def _populate_read_tab(self) -> None:
+        if self._read_tab_populated:
+            return
+        self._read_tab_populated = True
+        self.read_tab.searchable_table.add_items(self._pending_read)
+        self._pending_read = []
+
+    @on(TabbedContent.TabActivated)
+    def handle_tab_activated(self, message: TabbedContent.TabActivated) -> None:
+        if message.pane is self.read_tab:
+            self._populate_read_tab()
 
     def action_view_read(self) -> None:
-        self.query_one(TabbedContent).active = "read"
+        self._populate_read_tab()
+        self.tabs.active = "read"
         self.read_tab.searchable_table.table.focus()
 
     def action_view_unread(self) -> None:
-        self.query_one(TabbedContent).active = "unread"
+        self.tabs.active = "unread"
         self.unread_tab.searchable_table.table.focus()
 
     async def load_more_unread_notifications(self, batch_size: int, batch_to_fetch: int) -> list[Notification]:
@@ -157,29 +240,52 @@ class NotificationsContainer(Container):
         notifs = await fetch_notifications(True, batch_size, batch_to_fetch)
         return [n for n in notifs if not n.unread]
 
-    @work
-    async def load_notifications(self) -> None:
-        notifications = await fetch_notifications(True)
-
-        unread_count = 0
-        for notification in notifications:
-            if notification.unread:
-                unread_count += 1
-                self.unread_tab.searchable_table.add_item(notification)
-            else:
-                self.read_tab.searchable_table.add_item(notification)
-
+    def _show_loaded_notifications(self) -> None:
         self.unread_tab.searchable_table.loading = False
         self.read_tab.searchable_table.loading = False
 
-        if unread_count:
+        if self.unread_tab.searchable_table.items:
             self.action_view_unread()
         else:
             self.action_view_read()
 
+    @work
+    async def load_notifications(self) -> None:
+        # Notifications are added to the tables as each page arrives so that the first rows show up as soon as possible
+        pages_loaded = 0
+        async for notifications in fetch_notifications_pages(True):
+            unread: list[Notification] = []
+            read: list[Notification] = []
+            for notification in notifications:
+                (unread if notification.unread else read).append(notification)
+
+            self.unread_tab.searchable_table.add_items(unread)
+            self._add_read_notifications(read)
+
+            pages_loaded += 1
+            if pages_loaded == 1:
+                self._show_loaded_notifications()
+
+        if pages_loaded == 0:
+            self._show_loaded_notifications()
+
+        # The read tab lazily loads more pages of all notifications, so it should pick up after the pages we've streamed
+        self.read_tab.searchable_table.current_batch = pages_loaded
+
     def on_mount(self) -> None:
         self.load_notifications()
 
+    def _log_notifications_not_marked_read(self, notifications: list[Notification]) -> None:
+        lg.error(f"Could not mark {len(notifications)} notification(s) as read after the notifications were closed")
+
+    def on_unmount(self) -> None:
+        # Make sure anything that was marked as read right before the modal was closed still gets sent to Github. The
+        # tables are going away, so failures can't be moved back into the unread tab anymore and are only logged.
+        self.read_batcher.on_failure = self._log_notifications_not_marked_read
+        self.read_batcher.flush_now()
+        # The formatted rows are only useful while the tables are around, so don't keep them for the life of the app
+        _NOTIFICATION_ROWS.clear()
+
 
 class NotificationsModal(ModalScreen[Notification | None]):
     DEFAULT_CSS = """
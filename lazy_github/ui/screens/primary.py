@@ -1,19 +1,26 @@
+import asyncio
 from functools import partial
-from typing import NamedTuple
+from typing import Awaitable, Callable, NamedTuple
 
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.command import Hit, Hits, Provider
 from textual.containers import Container, Horizontal
+from textual.fuzzy import Matcher
 from textual.reactive import reactive
 from textual.screen import Screen
 from textual.timer import Timer
-from textual.types import IgnoreReturnCallbackType
 from textual.widget import Widget
 from textual.widgets import TabbedContent, Tabs
+from textual.worker import Worker
 
 from lazy_github.lib.bindings import LazyGithubBindings
-from lazy_github.lib.constants import NOTIFICATION_REFRESH_INTERVAL
+from lazy_github.lib.constants import (
+    NOTIFICATION_REFRESH_DEBOUNCE,
+    NOTIFICATION_REFRESH_INTERVAL,
+    REPO_SELECTION_DEBOUNCE,
+)
 from lazy_github.lib.context import LazyGithubContext
 from lazy_github.lib.github.auth import is_logged_in_to_cli
 from lazy_github.lib.github.backends.protocol import GithubApiRequestFailed
@@ -21,13 +28,8 @@ from lazy_github.lib.github.issues import list_issues
 from lazy_github.lib.github.notifications import extract_notification_subject, unread_notification_count
 from lazy_github.lib.github.pull_requests import get_full_pull_request
 from lazy_github.lib.logging import lg
-from lazy_github.lib.messages import (
-    IssuesAndPullRequestsFetched,
-    IssueSelected,
-    PullRequestSelected,
-    RepoSelected,
-)
-from lazy_github.models.github import Issue, PartialPullRequest, Repository
+from lazy_github.lib.messages import IssueSelected, PullRequestSelected, RepoSelected
+from lazy_github.models.github import FullPullRequest, Issue, PartialPullRequest, Repository
 from lazy_github.ui.screens.new_issue import NewIssueModal
 from lazy_github.ui.screens.new_pull_request import NewPullRequestModal
 from lazy_github.ui.screens.notifications import NotificationsModal
@@ -48,25 +50,35 @@ from lazy_github.ui.widgets.workflows import WorkflowsContainer
 
 class CurrentlySelectedRepo(Widget):
     current_repo_name: reactive[str | None] = reactive(None)
+    # The status bar is redrawn far more often than the repo changes, so the text is only built when it does
+    _rendered = Text("No repository selected")
 
-    def render(self):
-        if self.current_repo_name:
-            return f"Current repo: [green]{self.current_repo_name}[/green]"
+    def watch_current_repo_name(self, current_repo_name: str | None) -> None:
+        if current_repo_name:
+            self._rendered = Text.assemble("Current repo: ", (current_repo_name, "green"))
         else:
-            return "No repository selected"
+            self._rendered = Text("No repository selected")
+
+    def render(self):
+        return self._rendered
 
 
 class UnreadNotifications(Widget):
     notification_count: reactive[int | None] = reactive(None)
+    # The status bar is redrawn far more often than the count changes, so the text is only built when it does
+    _rendered = Text()
+
+    def watch_notification_count(self, notification_count: int | None) -> None:
+        if notification_count is None:
+            self._rendered = Text()
+        elif notification_count == 0:
+            self._rendered = Text("No unread notifications", style="green")
+        else:
+            count = f"{notification_count}+" if notification_count >= 30 else str(notification_count)
+            self._rendered = Text(f"• Unread Notifications: {count}", style="red")
 
     def render(self):
-        if self.notification_count is None:
-            return ""
-        elif self.notification_count == 0:
-            return "[green]No unread notifications[/green]"
-        else:
-            count = f"{self.notification_count}+" if self.notification_count >= 30 else str(self.notification_count)
-            return f"[red]• Unread Notifications: {count}[/red]"
+        return self._rendered
 
 
 class LazyGithubStatusSummary(Container):
@@ -92,10 +104,15 @@ class LazyGithubStatusSummary(Container):
     }
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.current_repo = CurrentlySelectedRepo(id="currently_selected_repo")
+        self.unread_notifications = UnreadNotifications(id="unread_notifications")
+
     def compose(self):
         with Horizontal():
-            yield CurrentlySelectedRepo(id="currently_selected_repo")
-            yield UnreadNotifications(id="unread_notifications")
+            yield self.current_repo
+            yield self.unread_notifications
 
 
 class SelectionDetailsContainer(LazyGithubContainer):
@@ -128,24 +145,29 @@ class SelectionsPane(Container):
     }
     """
 
-    def compose(self) -> ComposeResult:
-        yield ReposContainer(id="repos")
-        pulls = PullRequestsContainer(id="pull_requests")
-        pulls.display = LazyGithubContext.config.appearance.show_pull_requests
-        yield pulls
-
-        issues = IssuesContainer(id="issues")
-        issues.display = LazyGithubContext.config.appearance.show_issues
-        yield issues
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.repositories = ReposContainer(id="repos")
+        self.pull_requests = PullRequestsContainer(id="pull_requests")
+        self.issues = IssuesContainer(id="issues")
+        self.workflows = WorkflowsContainer(id="workflows")
+        self.update_displayed_sections()
 
-        workflows = WorkflowsContainer(id="workflows")
-        workflows.display = LazyGithubContext.config.appearance.show_workflows
-        yield workflows
+    def compose(self) -> ComposeResult:
+        yield self.repositories
+        yield self.pull_requests
+        yield self.issues
+        yield self.workflows
 
     def update_displayed_sections(self) -> None:
-        self.pull_requests.display = LazyGithubContext.config.appearance.show_pull_requests
-        self.issues.display = LazyGithubContext.config.appearance.show_issues
-        self.workflows.display = LazyGithubContext.config.appearance.show_workflows
+        appearance = LazyGithubContext.config.appearance
+        for section, show in (
+            (self.pull_requests, appearance.show_pull_requests),
+            (self.issues, appearance.show_issues),
+            (self.workflows, appearance.show_workflows),
+        ):
+            if section.display != show:
+                section.display = show
 
     def action_open_issue(self) -> None:
         self.trigger_issue_creation_flow()
@@ -171,23 +193,7 @@ class SelectionsPane(Container):
         if new_pr := await self.app.push_screen_wait(NewPullRequestModal()):
             self.pull_requests.searchable_table.add_item(new_pr)
 
-    @property
-    def repositories(self) -> ReposContainer:
-        return self.query_one("#repos", ReposContainer)
-
-    @property
-    def pull_requests(self) -> PullRequestsContainer:
-        return self.query_one("#pull_requests", PullRequestsContainer)
-
-    @property
-    def issues(self) -> IssuesContainer:
-        return self.query_one("#issues", IssuesContainer)
-
-    @property
-    def workflows(self) -> WorkflowsContainer:
-        return self.query_one("#workflows", WorkflowsContainer)
-
-    @work
+    @work(exclusive=True, group="fetch_issues_and_pull_requests")
     async def fetch_issues_and_pull_requests(self, repo: Repository) -> None:
         """
         Fetches the combined issues and pull requests from the Github API and then adds them to the appropriate tables.
@@ -195,6 +201,9 @@ class SelectionsPane(Container):
         Pull Requests are technically issues in the Github data model, so they are fetched by loading issues and then
         checking returned attributes to determine if those attributes indicate that an issue can be treated as a pull
         request instead.
+
+        Only the most recent fetch is kept: selecting another repo cancels a fetch that's still in flight so that its
+        results can't land on top of the newly selected repo.
         """
         state_filter = LazyGithubContext.config.issues.state_filter
         owner_filter = LazyGithubContext.config.issues.owner_filter
@@ -203,31 +212,46 @@ class SelectionsPane(Container):
         except GithubApiRequestFailed:
             lg.exception("Error fetching issues and PRs from Github API")
         else:
-            issue_and_pr_message = IssuesAndPullRequestsFetched(repo, issues_and_pull_requests)
-            self.pull_requests.post_message(issue_and_pr_message)
-            self.issues.post_message(issue_and_pr_message)
+            # Both sections are children of this pane, so hand them their results directly rather than messaging them
+            pull_requests: list[PartialPullRequest] = []
+            issues: list[Issue] = []
+            for issue in issues_and_pull_requests:
+                if isinstance(issue, PartialPullRequest):
+                    pull_requests.append(issue)
+                else:
+                    issues.append(issue)
+            self.pull_requests.set_pull_requests(pull_requests)
+            self.issues.set_issues(issues)
 
     async def load_repository(self, repo: Repository) -> None:
         """Loads more information about the specified repository, such as the PRs, issues, and workflows"""
-        if self.pull_requests.display or self.issues.display:
-            # Load things from the local file cache
+        # Kick off the requests for live data first, so that they're already in flight while we read the local file
+        # cache. The workers don't start running until we yield back to the event loop, by which point the cached
+        # data will already be in the tables for the live data to replace.
+        load_pulls_and_issues = self.pull_requests.display or self.issues.display
+        load_workflows = self.workflows.display
+        if load_pulls_and_issues:
+            self.fetch_issues_and_pull_requests(repo)
+        if load_workflows:
+            self.workflows.load_repo(repo)
+
+        if load_pulls_and_issues:
             self.pull_requests.load_cached_pull_requests_for_repo(repo)
             self.issues.load_cached_issues_for_repo(repo)
-            # Fetch the live data
-            self.fetch_issues_and_pull_requests(repo)
-        if self.workflows.display:
-            # Load things from the local file cache
+        if load_workflows:
             self.workflows.initialize_tables_from_cache(repo)
-            # Fetch the live data
-            self.workflows.load_repo(repo)
 
 
 class SelectionDetailsPane(Container):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.details = SelectionDetailsContainer(id="selection_details")
+        self.command_log_section = CommandLogSection(id="command_log")
+        self.command_log_section.display = LazyGithubContext.config.appearance.show_command_log
+
     def compose(self) -> ComposeResult:
-        yield SelectionDetailsContainer(id="selection_details")
-        command_log_section = CommandLogSection(id="command_log")
-        command_log_section.display = LazyGithubContext.config.appearance.show_command_log
-        yield command_log_section
+        yield self.details
+        yield self.command_log_section
 
 
 class MainViewPane(Container):
@@ -243,8 +267,15 @@ class MainViewPane(Container):
     def action_focus_section(self, selector: str) -> None:
         self.query_one(selector).focus()
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.selections = SelectionsPane(id="selections_pane")
+        self.details_pane = SelectionDetailsPane(id="details_pane")
+        # The PR or issue currently shown in the details tabs, so that selecting it again doesn't rebuild the tabs
+        self._displayed_selection: Issue | None = None
+
     def action_focus_workflow_tabs(self) -> None:
-        tabbed_content = self.query_one("#workflow_tabs", TabbedContent)
+        tabbed_content = self.selections.workflows.tabs
         if tabbed_content.children and tabbed_content.tab_count > 0:
             if tabbed_content.has_focus_within:
                 tabs = tabbed_content.query_one(Tabs)
@@ -253,7 +284,7 @@ class MainViewPane(Container):
                 tabbed_content.children[0].focus()
 
     def action_focus_tabs(self) -> None:
-        tabbed_content = self.query_one("#selection_detail_tabs", TabbedContent)
+        tabbed_content = self.details.tabs
         if tabbed_content.children and tabbed_content.tab_count > 0:
             if tabbed_content.has_focus_within:
                 tabs = tabbed_content.query_one(Tabs)
@@ -262,118 +293,207 @@ class MainViewPane(Container):
                 tabbed_content.children[0].focus()
 
     def compose(self) -> ComposeResult:
-        yield SelectionsPane(id="selections_pane")
-        yield SelectionDetailsPane(id="details_pane")
-
-    @property
-    def selections(self) -> SelectionsPane:
-        return self.query_one("#selections_pane", SelectionsPane)
+        yield self.selections
+        yield self.details_pane
 
     @property
     def details(self) -> SelectionDetailsContainer:
-        return self.query_one("#selection_details", SelectionDetailsContainer)
+        return self.details_pane.details
 
     async def load_repository(self, repo: Repository) -> None:
         await self.selections.load_repository(repo)
 
-    async def load_pull_request(self, pull_request: PartialPullRequest) -> None:
-        full_pr = await get_full_pull_request(pull_request.repo, pull_request.number)
-        tabbed_content = self.query_one("#selection_detail_tabs", TabbedContent)
-        await tabbed_content.clear_panes()
-        await tabbed_content.add_pane(PrOverviewTabPane(full_pr))
-        await tabbed_content.add_pane(PrDiffTabPane(full_pr))
-        await tabbed_content.add_pane(PrConversationTabPane(full_pr))
-        tabbed_content.children[0].focus()
-        self.details.border_title = f"[5] PR #{full_pr.number} Details"
+    # PRs and issues share a worker group so that selecting something new cancels the load of whatever came before it
+    @work(exclusive=True, group="load_selection_details")
+    async def load_pull_request(self, pull_request: PartialPullRequest, force: bool = False) -> None:
+        if not force and pull_request == self._displayed_selection:
+            self.details.tabs.children[0].focus()
+            return
+
+        self._displayed_selection = None
+        tabbed_content = self.details.tabs
+        if isinstance(pull_request, FullPullRequest) and not force:
+            # Callers such as the notification handling have sometimes already fetched the full PR
+            full_pr = pull_request
+        else:
+            # Clear out the previous selection while the full PR is being fetched. Forced loads skip the cache, since
+            # they're used when we know the PR has just changed.
+            updated_at = None if force else pull_request.updated_at
+            full_pr_task = asyncio.create_task(
+                get_full_pull_request(pull_request.repo, pull_request.number, updated_at)
+            )
+            try:
+                await tabbed_content.clear_panes()
+                full_pr = await full_pr_task
+            finally:
+                # A newer selection can cancel this load while the panes are being cleared, so make sure the fetch
+                # isn't left behind with nobody around to retrieve its result
+                if not full_pr_task.done():
+                    full_pr_task.cancel()
+                elif not full_pr_task.cancelled():
+                    full_pr_task.exception()
+
+        # Panes are added in the order they're listed here, so they can safely be mounted together
+        with self.app.batch_update():
+            if tabbed_content.tab_count:
+                # The previous selection is only still showing if there was nothing to fetch, in which case it's
+                # swapped out for the new one in the same repaint
+                await tabbed_content.clear_panes()
+            await asyncio.gather(
+                tabbed_content.add_pane(PrOverviewTabPane(full_pr)),
+                tabbed_content.add_pane(PrDiffTabPane(full_pr)),
+                tabbed_content.add_pane(PrConversationTabPane(full_pr)),
+            )
+            tabbed_content.children[0].focus()
+            self.details.border_title = f"[5] PR #{full_pr.number} Details"
+        self._displayed_selection = pull_request
 
+    @work(exclusive=True, group="load_selection_details")
     async def load_issue(self, issue: Issue) -> None:
-        tabbed_content = self.query_one("#selection_detail_tabs", TabbedContent)
-        await tabbed_content.clear_panes()
-        await tabbed_content.add_pane(IssueOverviewTabPane(issue))
-        await tabbed_content.add_pane(IssueConversationTabPane(issue))
-        tabbed_content.children[0].focus()
-        self.details.border_title = f"[5] Issue #{issue.number} Details"
+        if issue == self._displayed_selection:
+            self.details.tabs.children[0].focus()
+            return
+
+        self._displayed_selection = None
+        tabbed_content = self.details.tabs
+        # Nothing needs to be fetched before the issue panes can be shown, so swap them in a single repaint
+        with self.app.batch_update():
+            await tabbed_content.clear_panes()
+            await asyncio.gather(
+                tabbed_content.add_pane(IssueOverviewTabPane(issue)),
+                tabbed_content.add_pane(IssueConversationTabPane(issue)),
+            )
+            tabbed_content.children[0].focus()
+            self.details.border_title = f"[5] Issue #{issue.number} Details"
+        self._displayed_selection = issue
 
     @on(PullRequestSelected)
-    async def handle_pull_request_selection(self, message: PullRequestSelected) -> None:
-        await self.load_pull_request(message.pr)
+    def handle_pull_request_selection(self, message: PullRequestSelected) -> None:
+        self.load_pull_request(message.pr, force=message.force)
 
     @on(IssueSelected)
-    async def handle_issue_selection(self, message: IssueSelected) -> None:
-        await self.load_issue(message.issue)
+    def handle_issue_selection(self, message: IssueSelected) -> None:
+        self.load_issue(message.issue)
 
 
 class LazyGithubCommand(NamedTuple):
     name: str
-    action: IgnoreReturnCallbackType
+    # Takes the screen the palette was opened on, so that the same commands can be shared between screens
+    action: Callable[["LazyGithubMainScreen"], Awaitable[None]]
     help_text: str
 
 
 class MainScreenCommandProvider(Provider):
+    # Searches run on every keystroke in the palette, so the commands are only built once for each setting of the
+    # notifications flag (the only thing that changes which commands are available). A new provider is created each
+    # time the palette is opened, so these are kept on the class rather than on the instance. The commands aren't bound
+    # to a screen, so the cache doesn't keep any screens alive.
+    _commands_cache: dict[bool, tuple[LazyGithubCommand, ...]] = {}
+    _command_characters: dict[str, frozenset[str]] = {}
+    # The (name, section ID, help text) for each of the sections that can be toggled from the palette
+    _TOGGLE_COMMANDS: tuple[tuple[str, str, str], ...] = (
+        ("Toggle Command Log", "command_log", "Toggle showing or hiding the command log"),
+        ("Toggle Workflows", "workflows", "Toggle showing or hiding repo actions"),
+        ("Toggle Issues", "issues", "Toggle showing or hiding repo issues"),
+        ("Toggle Pull Requests", "pull_requests", "Toggle showing or hiding repo pull requests"),
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # The score for each (query, command name) pair we've matched while the palette is open, since typing and
+        # deleting characters keeps revisiting the same queries
+        self._match_scores: dict[tuple[str, str], float] = {}
+
     @property
     def commands(self) -> tuple[LazyGithubCommand, ...]:
-        assert isinstance(self.screen, LazyGithubMainScreen)
-
-        toggle_ui = self.screen.action_toggle_ui
+        notifications_enabled = LazyGithubContext.config.notifications.enabled
+        if notifications_enabled not in self._commands_cache:
+            self._commands_cache[notifications_enabled] = self._build_commands(notifications_enabled)
+        return self._commands_cache[notifications_enabled]
 
+    def _build_commands(self, notifications_enabled: bool) -> tuple[LazyGithubCommand, ...]:
         _commands: list[LazyGithubCommand] = [
-            LazyGithubCommand(
-                "Toggle Command Log", partial(toggle_ui, "command_log"), "Toggle showing or hiding the command log"
-            ),
-            LazyGithubCommand(
-                "Toggle Workflows", partial(toggle_ui, "workflows"), "Toggle showing or hiding repo actions"
-            ),
-            LazyGithubCommand("Toggle Issues", partial(toggle_ui, "issues"), "Toggle showing or hiding repo issues"),
-            LazyGithubCommand(
-                "Toggle Pull Requests",
-                partial(toggle_ui, "pull_requests"),
-                "Toggle showing or hiding repo pull requests",
-            ),
-            LazyGithubCommand("Change Settings", self.screen.action_show_settings_modal, "Adjust LazyGithub settings"),
+            LazyGithubCommand(name, partial(LazyGithubMainScreen.action_toggle_ui, ui_to_hide=section_id), help_text)
+            for name, section_id, help_text in self._TOGGLE_COMMANDS
         ]
+        _commands.append(
+            LazyGithubCommand(
+                "Change Settings", LazyGithubMainScreen.action_show_settings_modal, "Adjust LazyGithub settings"
+            )
+        )
 
-        if LazyGithubContext.config.notifications.enabled:
+        if notifications_enabled:
             _commands.append(
                 LazyGithubCommand(
                     "Refresh notifications",
-                    self.screen.action_refresh_notifications,
+                    LazyGithubMainScreen.action_refresh_notifications,
                     "Refresh the unread notifications count",
                 )
             )
 
-        return tuple(_commands)
+        commands = tuple(_commands)
+        for command in commands:
+            self._command_characters[command.name] = frozenset(command.name.lower())
+        return commands
+
+    def _could_match(self, query_characters: frozenset[str], command: LazyGithubCommand) -> bool:
+        """
+        A cheap check for whether the fuzzy matcher could possibly match the command: every character in the query has
+        to appear somewhere in the command name.
+        """
+        return query_characters <= self._command_characters[command.name]
+
+    def _match_score(self, matcher: Matcher, command: LazyGithubCommand) -> float:
+        key = (matcher.query, command.name)
+        if key not in self._match_scores:
+            self._match_scores[key] = matcher.match(command.name)
+        return self._match_scores[key]
 
     async def search(self, query: str) -> Hits:
+        assert isinstance(self.screen, LazyGithubMainScreen)
         matcher = self.matcher(query)
+        query_characters = frozenset(query.lower())
         for command in self.commands:
-            if (match := matcher.match(command.name)) > 0:
-                yield Hit(
-                    match,
-                    matcher.highlight(command.name),
-                    command.action,
-                    help=command.help_text,
-                )
+            if not self._could_match(query_characters, command):
+                continue
+            score = self._match_score(matcher, command)
+            if score > 0:
+                # Highlighting uses the current theme's match style, so it's only done for the hits that are shown
+                highlighted_name = matcher.highlight(command.name)
+                yield Hit(score, highlighted_name, partial(command.action, self.screen), help=command.help_text)
 
 
 class LazyGithubMainScreen(Screen):
     BINDINGS = [LazyGithubBindings.OPEN_NOTIFICATIONS_MODAL]
     COMMANDS = {MainScreenCommandProvider}
     notification_refresh_timer: Timer | None = None
+    notification_refresh_debounce: Timer | None = None
+    notification_refresh_worker: Worker[None] | None = None
+    repo_selection_debounce: Timer | None = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.status_summary = LazyGithubStatusSummary()
+        self.main_view_pane = MainViewPane(id="main-view-pane")
+        # The sections that can be shown or hidden from the command palette, keyed by their IDs
+        self.toggleable_sections: dict[str, Widget] = {
+            "command_log": self.main_view_pane.details_pane.command_log_section,
+            "workflows": self.main_view_pane.selections.workflows,
+            "issues": self.main_view_pane.selections.issues,
+            "pull_requests": self.main_view_pane.selections.pull_requests,
+        }
 
     def compose(self):
         with Container():
-            yield LazyGithubStatusSummary()
-            yield MainViewPane(id="main-view-pane")
+            yield self.status_summary
+            yield self.main_view_pane
             yield LazyGithubFooter()
 
-    @property
-    def main_view_pane(self) -> MainViewPane:
-        return self.query_one("#main-view-pane", MainViewPane)
-
     @work
     async def action_view_notifications(self) -> None:
         notification = await self.app.push_screen_wait(NotificationsModal())
-        self.refresh_notification_count()
+        # Notifications may have been marked as read while the modal was open, so the cached count can't be trusted
+        self.request_notification_count_refresh(force=True)
 
         if not notification:
             return
@@ -391,59 +511,87 @@ class LazyGithubMainScreen(Screen):
                 self.notify("Opening repository for notification")
                 return
             case PartialPullRequest():
-                await self.main_view_pane.load_pull_request(subject)
+                self.main_view_pane.load_pull_request(subject)
                 self.notify("Opening pull request for notification")
 
     async def on_mount(self) -> None:
         if LazyGithubContext.config.notifications.enabled:
-            self.refresh_notification_count()
+            self.request_notification_count_refresh()
             if self.notification_refresh_timer is None:
                 self.notification_refresh_timer = self.set_interval(
-                    NOTIFICATION_REFRESH_INTERVAL, self.refresh_notification_count
+                    NOTIFICATION_REFRESH_INTERVAL, self.request_notification_count_refresh
                 )
 
-    @work(thread=True)
-    async def refresh_notification_count(self) -> None:
-        widget = self.query_one("#unread_notifications", UnreadNotifications)
+    @work(exclusive=True, group="notifications")
+    async def refresh_notification_count(self, force: bool = False) -> None:
+        widget = self.status_summary.unread_notifications
         if LazyGithubContext.config.notifications.enabled:
-            if not await is_logged_in_to_cli():
+            if not await is_logged_in_to_cli(force=force):
                 error_message = "Cannot load notifications - please login to the gh CLI: gh auth login"
                 self.notify(error_message, title="Failed to Load Notifiations", severity="error")
                 lg.error(error_message)
                 return
 
-            unread_count = await unread_notification_count()
-            widget.notification_count = unread_count
+            # Reactives skip their watchers when the value hasn't changed, so this is cheap when the count is the same
+            widget.notification_count = await unread_notification_count(force=force)
         else:
             widget.notification_count = None
 
+    def request_notification_count_refresh(self, force: bool = False) -> None:
+        """
+        Refreshes the notification count. Unless forced, a refresh that's already in progress is left to finish rather
+        than being cancelled and started over.
+        """
+        in_flight = self.notification_refresh_worker is not None and not self.notification_refresh_worker.is_finished
+        if force or not in_flight:
+            self.notification_refresh_worker = self.refresh_notification_count(force=force)
+
+    def schedule_notification_count_refresh(self, force: bool = False) -> None:
+        """Refreshes the notification count once things have settled, so that a burst of triggers only refreshes once"""
+        if self.notification_refresh_debounce is not None:
+            self.notification_refresh_debounce.stop()
+        self.notification_refresh_debounce = self.set_timer(
+            NOTIFICATION_REFRESH_DEBOUNCE, partial(self.request_notification_count_refresh, force=force)
+        )
+
     async def action_refresh_notifications(self) -> None:
         """Action handler that retriggers the notification loading"""
-        self.refresh_notification_count()
+        self.schedule_notification_count_refresh(force=True)
 
     async def action_toggle_ui(self, ui_to_hide: str):
-        widget = self.query_one(f"#{ui_to_hide}", Widget)
+        if (widget := self.toggleable_sections.get(ui_to_hide)) is None:
+            widget = self.query_one(f"#{ui_to_hide}", Widget)
         widget.display = not widget.display
 
     async def action_show_settings_modal(self) -> None:
         self.app.push_screen(SettingsModal())
 
     def handle_settings_update(self) -> None:
-        self.query_one("#selections_pane", SelectionsPane).update_displayed_sections()
+        self.main_view_pane.selections.update_displayed_sections()
 
-        self.refresh_notification_count()
+        self.schedule_notification_count_refresh()
         if self.notification_refresh_timer is None:
             self.notification_refresh_timer = self.set_interval(
-                NOTIFICATION_REFRESH_INTERVAL, self.refresh_notification_count
+                NOTIFICATION_REFRESH_INTERVAL, self.request_notification_count_refresh
             )
 
     def set_currently_loaded_repo(self, repo: Repository) -> None:
         lg.info(f"Selected repo {repo.full_name}")
         LazyGithubContext.current_repo = repo
-        self.query_one("#currently_selected_repo", CurrentlySelectedRepo).current_repo_name = repo.full_name
+        self.status_summary.current_repo.current_repo_name = repo.full_name
 
     @on(RepoSelected)
     async def handle_repo_selection(self, message: RepoSelected) -> None:
+        current_repo = LazyGithubContext.current_repo
+        if not message.force and current_repo is not None and current_repo.full_name == message.repo.full_name:
+            # Reselecting the repo that's already loaded would just refetch everything we're already showing
+            return
+
         self.set_currently_loaded_repo(message.repo)
         assert LazyGithubContext.current_repo == message.repo
-        await self.main_view_pane.selections.load_repository(message.repo)
+        # Selecting several repos in quick succession should only load the last of them
+        if self.repo_selection_debounce is not None:
+            self.repo_selection_debounce.stop()
+        self.repo_selection_debounce = self.set_timer(
+            REPO_SELECTION_DEBOUNCE, partial(self.main_view_pane.selections.load_repository, message.repo)
+        )
@@ -1,5 +1,6 @@
 import enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -7,13 +8,12 @@ from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
-from textual.css.query import NoMatches
 from textual.events import Key
 from textual.fuzzy import Matcher
 from textual.screen import ModalScreen
 from textual.theme import BUILTIN_THEMES, Theme
+from textual.timer import Timer
 from textual.validation import ValidationResult, Validator
-from textual.widget import Widget
 from textual.widgets import Button, Collapsible, Input, Label, Markdown, RichLog, Rule, Select, Static, Switch
 
 from lazy_github.lib.bindings import LazyGithubBindings
@@ -21,7 +21,34 @@ from lazy_github.lib.context import LazyGithubContext
 from lazy_github.lib.messages import SettingsModalDismissed
 from lazy_github.ui.widgets.common import LazyGithubFooter, ToggleableSearchInput
 
+SelectOptions = tuple[tuple[str, str], ...]
 
+# How long typing in the settings search has to pause before the settings are filtered
+_SETTINGS_SEARCH_DEBOUNCE = 0.05
+
+# The built-in themes don't change while the app is running, so their dropdown options only need to be built once
+_THEME_OPTIONS: SelectOptions = tuple((t.title().replace("-", " "), t) for t in BUILTIN_THEMES.keys())
+
+
+@lru_cache(maxsize=None)
+def _enum_options(enum_type: type[enum.StrEnum]) -> SelectOptions:
+    return tuple((t.title(), t) for t in enum_type)
+
+
+@lru_cache(maxsize=None)
+def _visible_fields(model_type: type[BaseModel]) -> tuple[tuple[str, FieldInfo], ...]:
+    """The fields on a settings model that are shown in the UI, which leaves out any excluded fields"""
+    return tuple((name, field) for name, field in model_type.model_fields.items() if not field.exclude)
+
+
+@lru_cache(maxsize=None)
+def _rebindable_bindings() -> tuple[Binding, ...]:
+    """The bindings that can be overridden in the settings, sorted by their ID. These are fixed when the app starts."""
+    bindings_by_id = LazyGithubBindings.all_by_id()
+    return tuple(bindings_by_id[binding_id] for binding_id in sorted(bindings_by_id))
+
+
+@lru_cache(maxsize=None)
 def _field_name_to_readable_name(name: str) -> str:
     return name.replace("_", " ").title()
 
@@ -30,6 +57,14 @@ def _id_for_field_input(field_name: str) -> str:
     return f"adjust_{field_name}_input"
 
 
+def _matches_search(matcher: Matcher, search_name: str) -> bool:
+    """
+    Checks whether a lowercased setting name matches the (also lowercased) search query. A plain substring check is far
+    cheaper than a fuzzy match and anything it finds would fuzzy match anyway, so that's tried first.
+    """
+    return matcher.query in search_name or matcher.match(search_name) > 0
+
+
 class ListOfStringValidator(Validator):
     def validate(self, value: str) -> ValidationResult:
         stripped_value = value.strip()
@@ -51,20 +86,19 @@ class FieldSetting(Container):
     }
     """
 
-    def _field_to_widget(self) -> Widget:
+    def _field_to_widget(self) -> Switch | Select | Input:
         id = _id_for_field_input(self.field_name)
         if self.field.annotation is bool:
             # If the setting is a boolean, render a on/off switch
             return Switch(value=self.value, id=id)
         elif isinstance(self.field.annotation, type) and issubclass(self.field.annotation, enum.StrEnum):
             # If the setting is an enum, then we'll render a dropdown with all of the available options
-            return Select(options=[(t.title(), t) for t in list(self.field.annotation)], value=self.value, id=id)
+            return Select(options=_enum_options(self.field.annotation), value=self.value, id=id)
         elif isinstance(self.field.annotation, type) and issubclass(self.field.annotation, Theme):
-            theme_options = [(t.title().replace("-", " "), t) for t in BUILTIN_THEMES.keys()]
             if isinstance(self.value, Theme):
-                return Select(options=theme_options, value=self.value.name, id=id)
+                return Select(options=_THEME_OPTIONS, value=self.value.name, id=id)
             else:
-                return Select(options=theme_options, value=self.value, id=id)
+                return Select(options=_THEME_OPTIONS, value=self.value, id=id)
         elif self.field.annotation == list[str]:
             return Input(value=str(", ".join(self.value)), id=id, validators=[ListOfStringValidator()])
         else:
@@ -76,10 +110,12 @@ class FieldSetting(Container):
         self.field_name = field_name
         self.field = field
         self.value = value
+        self.search_names = (field_name.lower(),)
+        self.value_input = self._field_to_widget()
 
     def compose(self) -> ComposeResult:
         yield Label(f"[bold]{_field_name_to_readable_name(self.field_name)}:[/bold]")
-        yield self._field_to_widget()
+        yield self.value_input
 
 
 class SettingsSection(Vertical):
@@ -98,29 +134,38 @@ class SettingsSection(Vertical):
         super().__init__()
         self.parent_field_name = parent_field_name
         self.model = model
-        self.fields = model.model_fields
+        self.fields = _visible_fields(type(model))
 
         self.field_settings_widgets: list[FieldSetting] = []
 
-    def filter_field_settings(self, matcher: Matcher | None) -> None:
+    def searchable_settings(self) -> Sequence["FieldSetting | KeySelectionInput"]:
+        return self.field_settings_widgets
+
+    def filter_field_settings(self, matcher: Matcher | None, narrowing: bool = False) -> None:
+        """
+        Shows only the settings matching the search. If the search is narrowing the previous one (by adding characters
+        to the end of it), then settings that were already hidden can't match and are skipped.
+        """
         at_least_one_displayed = False
-        for field_setting in self.field_settings_widgets:
-            if matcher is None or matcher.match(field_setting.field_name):
+        for setting in self.searchable_settings():
+            if narrowing and not setting.display:
+                continue
+            # We'll show the setting if there is no query or if the query matches any of the setting's names
+            if matcher is None or any(_matches_search(matcher, name) for name in setting.search_names):
                 at_least_one_displayed = True
-                field_setting.display = True
+                setting.display = True
             else:
-                field_setting.display = False
+                setting.display = False
 
-        self.query_one(Collapsible).collapsed = not at_least_one_displayed
+        self.collapsible.collapsed = not at_least_one_displayed
 
     def compose(self) -> ComposeResult:
         setting_description = self.model.__doc__ or ""
         field_name = f"[bold]{_field_name_to_readable_name(self.parent_field_name)}[/bold]"
-        with Collapsible(collapsed=False, title=field_name):
+        with Collapsible(collapsed=False, title=field_name) as collapsible:
+            self.collapsible = collapsible
             yield Static(f"{setting_description}".strip())
-            for field_name, field_info in self.fields.items():
-                if field_info.exclude:
-                    continue
+            for field_name, field_info in self.fields:
                 current_value = getattr(self.model, field_name)
                 new_field_setting = FieldSetting(field_name, field_info, current_value)
                 self.field_settings_widgets.append(new_field_setting)
@@ -144,6 +189,8 @@ class KeySelectionInput(Container):
         super().__init__()
         self.binding = binding
         self.key_input = RichLog()
+        # Bindings can be searched for by either their description or their ID
+        self.search_names = tuple(name.lower() for name in (binding.description, binding.id) if name)
 
         if binding.id and binding.id in LazyGithubContext.config.bindings.overrides:
             self.key_input.write(LazyGithubContext.config.bindings.overrides[binding.id])
@@ -151,6 +198,11 @@ class KeySelectionInput(Container):
         else:
             self.key_input.write(binding.key)
             self.value = binding.key
+        self.initial_value = self.value
+
+    @property
+    def changed(self) -> bool:
+        return self.value != self.initial_value
 
     def compose(self) -> ComposeResult:
         with Horizontal():
@@ -169,33 +221,20 @@ class KeySelectionInput(Container):
 class BindingsSettingsSection(SettingsSection):
     def __init__(self) -> None:
         super().__init__("bindings", LazyGithubContext.config.bindings)
+        self.key_selection_inputs: list[KeySelectionInput] = []
 
-    def filter_field_settings(self, matcher: Matcher | None) -> None:
-        """Overridden filter handler for the bindings settings"""
-        at_least_one_displayed = False
-        key_selection_inputs = self.query(KeySelectionInput)
-        for ksi in key_selection_inputs:
-            if (
-                # We'll show the binding if there is no query or if the query matches the description/id
-                matcher is None
-                or (ksi.binding.description and matcher.match(ksi.binding.description))
-                or (ksi.binding.id and matcher.match(ksi.binding.id))
-            ):
-                at_least_one_displayed = True
-                ksi.display = True
-            else:
-                ksi.display = False
-
-        self.query_one(Collapsible).collapsed = not at_least_one_displayed
+    def searchable_settings(self) -> Sequence["FieldSetting | KeySelectionInput"]:
+        return self.key_selection_inputs
 
     def compose(self) -> ComposeResult:
-        with Collapsible(collapsed=False, title="[bold]Keybinding Overrides[/bold]"):
+        with Collapsible(collapsed=False, title="[bold]Keybinding Overrides[/bold]") as collapsible:
+            self.collapsible = collapsible
             if LazyGithubContext.config.bindings.__doc__:
                 yield Static(LazyGithubContext.config.bindings.__doc__)
-            bindings_by_id = LazyGithubBindings.all_by_id()
-            sorted_binding_keys = sorted(bindings_by_id.keys())
-            for key in sorted_binding_keys:
-                yield KeySelectionInput(bindings_by_id[key])
+            for binding in _rebindable_bindings():
+                key_selection_input = KeySelectionInput(binding)
+                self.key_selection_inputs.append(key_selection_input)
+                yield key_selection_input
 
 
 class SettingsContainer(Container):
@@ -226,6 +265,9 @@ class SettingsContainer(Container):
         self.search_input.can_focus = False
 
         self.settings_sections: list[SettingsSection] = []
+        self.bindings_section = BindingsSettingsSection()
+        self.search_debounce: Timer | None = None
+        self.last_search_query = ""
 
     def compose(self) -> ComposeResult:
         yield Markdown("# LazyGithub Settings")
@@ -233,11 +275,11 @@ class SettingsContainer(Container):
         with ScrollableContainer():
             for field, value in LazyGithubContext.config:
                 if field == "bindings":
-                    yield BindingsSettingsSection()
+                    new_section = self.bindings_section
                 else:
                     new_section = SettingsSection(field, value)
-                    self.settings_sections.append(new_section)
-                    yield new_section
+                self.settings_sections.append(new_section)
+                yield new_section
 
         yield Rule()
 
@@ -251,40 +293,41 @@ class SettingsContainer(Container):
         self.search_input.focus()
 
     async def change_displayed_settings(self, query: str) -> None:
-        all_sections = self.query(SettingsSection)
         matcher = Matcher(query) if query else None
-        for section in all_sections:
-            section.filter_field_settings(matcher)
+        narrowing = bool(self.last_search_query) and query.startswith(self.last_search_query)
+        self.last_search_query = query
+        for section in self.settings_sections:
+            section.filter_field_settings(matcher, narrowing)
 
-    @on(Input.Submitted, "#settings_search_input")
-    async def handle_submitted_search(self) -> None:
+    async def filter_from_search_input(self) -> None:
         search_query = self.search_input.value.strip().lower()
         await self.change_displayed_settings(search_query)
 
+    @on(Input.Changed, "#settings_search_input")
+    def handle_search_changed(self) -> None:
+        # Filter as the user types, but only once they pause so that a burst of keystrokes results in a single pass
+        if self.search_debounce is not None:
+            self.search_debounce.stop()
+        self.search_debounce = self.set_timer(_SETTINGS_SEARCH_DEBOUNCE, self.filter_from_search_input)
+
+    @on(Input.Submitted, "#settings_search_input")
+    async def handle_submitted_search(self) -> None:
+        if self.search_debounce is not None:
+            self.search_debounce.stop()
+        await self.filter_from_search_input()
+
     def _update_settings(self):
         with LazyGithubContext.config.to_edit() as updated_config:
-            for section_setting_name, model in updated_config:
-                if not isinstance(model, BaseModel) or section_setting_name == "bindings":
-                    continue
-
-                for field_name, _ in model:
-                    value_adjustment_id = _id_for_field_input(field_name)
-                    try:
-                        updated_value_input = self.query_one(f"#{value_adjustment_id}")
-                    except NoMatches:
-                        # If there isn't a way to adjust this setting, skip it
-                        continue
-
-                    if not isinstance(updated_value_input, (Switch, Input, Select)):
-                        raise TypeError(
-                            f"Unexpected value input type: {type(updated_value_input)}. Please file an issue"
-                        )
-
-                    setattr(model, field_name, updated_value_input.value)
-
-            # We want to handle the binding settings update differently
-            keybinding_adjustments = self.query(KeySelectionInput)
-            for adjustment in keybinding_adjustments:
+            # Each section holds on to the inputs for its own fields, which also keeps fields that share a name across
+            # sections (such as the PR and issue state filters) from being mixed up with one another
+            for section in self.settings_sections:
+                model = getattr(updated_config, section.parent_field_name)
+                for field_setting in section.field_settings_widgets:
+                    setattr(model, field_setting.field_name, field_setting.value_input.value)
+
+            # We want to handle the binding settings update differently, only touching the overrides that were changed
+            changed_adjustments = [a for a in self.bindings_section.key_selection_inputs if a.changed]
+            for adjustment in changed_adjustments:
                 if adjustment.value != adjustment.binding.key and adjustment.binding.id:
                     LazyGithubContext.config.bindings.overrides[adjustment.binding.id] = adjustment.value
                 elif adjustment.binding.id in LazyGithubContext.config.bindings.overrides:
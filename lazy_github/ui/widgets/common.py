@@ -1,4 +1,4 @@
-from asyncio import Lock
+from asyncio import Lock, Task, create_task
 from datetime import datetime
 from typing import Awaitable, Callable, Generic, TypeVar
 
@@ -6,9 +6,10 @@ from pydantic import BaseModel
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
+from textual.coordinate import Coordinate
 from textual.events import Blur
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Input
-from textual.widgets.data_table import RowDoesNotExist
 
 from lazy_github.lib.bindings import LazyGithubBindings
 from lazy_github.lib.cache import load_models_from_cache, save_models_to_cache
@@ -23,6 +24,9 @@ TableCellType = str | int | datetime
 TableRow = tuple[TableCellType, ...]
 TableRowMap = dict[str, tuple[TableCellType, ...]]
 
+# How long the cursor needs to settle near the end of a lazily loaded table before we fetch more data
+LOAD_MORE_DEBOUNCE_SECONDS = 0.15
+
 
 class LazyGithubFooter(Footer):
     def __init__(self) -> None:
@@ -92,13 +96,34 @@ class SearchableDataTable(Vertical, Generic[T]):
         self.cache_name = cache_name
         self.repo_based_cache = repo_based_cache
         self.items: dict[str, T] = {}
+        # The repo the rows in this table were loaded for, which isn't necessarily the currently selected repo while a
+        # new selection is still loading
+        self.cache_repo: Repository | None = None
+        self._sort_pending = False
+        self._save_pending = False
 
     def item_in_table(self, item: T) -> bool:
         return self.item_to_key(item) in self.items
 
     def sort_table(self):
+        self._sort_pending = False
         self.table.sort(self.sort_key, reverse=self.reverse_sort)
 
+    def schedule_sort(self) -> None:
+        """Sorts the table after the next refresh so that several additions in a row only result in a single sort"""
+        if not self.is_mounted:
+            self.sort_table()
+            return
+
+        if not self._sort_pending:
+            self._sort_pending = True
+            self.call_after_refresh(self.sort_table)
+
+    def get_selected_item(self) -> T:
+        """Returns the item for the row under the cursor, using the row key rather than reading any cell values"""
+        row_key, _ = self.table.coordinate_to_cell_key(Coordinate(self.table.cursor_row, 0))
+        return self.items[str(row_key.value)]
+
     def compose(self) -> ComposeResult:
         yield self.search_input
         yield self.table
@@ -111,12 +136,14 @@ class SearchableDataTable(Vertical, Generic[T]):
 
     def clear_rows(self):
         """Removes all rows currently displayed and tracked in this table"""
+        self.flush_cache()
         self.items = {}
         self.table.clear()
 
     def initialize_from_cache(self, repo: Repository | None, expect_type: type[T]) -> None:
         """Loads values expected to be of the specified type from the cache for this table"""
         self.clear_rows()
+        self.cache_repo = repo
         if not self.cache_name:
             return
 
@@ -127,40 +154,84 @@ class SearchableDataTable(Vertical, Generic[T]):
 
     def save_to_cache(self):
         """Saves the models in the table to the specified cache location, if one is set"""
+        self._save_pending = False
         if not self.cache_name:
             return
 
         save_models_to_cache(
-            LazyGithubContext.current_repo if self.repo_based_cache else None,
+            (self.cache_repo or LazyGithubContext.current_repo) if self.repo_based_cache else None,
             self.cache_name,
             self.items.values(),
         )
 
-    def add_item(self, item: T, write_to_cache: bool = True) -> None:
-        """Add an individual row with the specified key to the table. The table will be sorted after the key is added"""
-        item_key = self.item_to_key(item)
-        try:
-            # Before we add the row, we want to see if the key already exists
-            if item_key in self.items:
-                self.table.remove_row(item_key)
-        except RowDoesNotExist:
-            # If the row doesn't exist, then something already removed it and we can move on
-            pass
-
-        self.items[item_key] = item
-        self.table.add_row(*self.item_to_row(item), key=item_key)
-        self.table.sort(self.sort_key, reverse=self.reverse_sort)
+    def schedule_save_to_cache(self) -> None:
+        """Saves the table to the cache after the next refresh so that several additions in a row only write once"""
+        if not self.cache_name:
+            return
+
+        if not self.is_mounted:
+            self.save_to_cache()
+        elif not self._save_pending:
+            self._save_pending = True
+            self.call_after_refresh(self.flush_cache)
 
-        if write_to_cache and self.cache_name:
+    def flush_cache(self) -> None:
+        """Immediately writes out any save to the cache that's still waiting on a refresh"""
+        if self._save_pending:
             self.save_to_cache()
 
+    def on_unmount(self) -> None:
+        self.flush_cache()
+
+    def add_item(self, item: T, write_to_cache: bool = True) -> None:
+        """Add an individual row with the specified key to the table. The table will be sorted after the next refresh"""
+        self.add_items([item], write_to_cache=write_to_cache)
+
     def add_items(self, new_items: list[T], write_to_cache: bool = True) -> None:
-        """Add new rows to the currently displayed table and cache"""
-        for item in new_items:
-            self.add_item(item, write_to_cache=False)
+        """
+        Add new rows to the currently displayed table and cache. The table is only sorted once, after all of the rows
+        have been added and any other pending additions have been processed.
+        """
+        items_by_key = {self.item_to_key(item): item for item in new_items}
+        if not items_by_key:
+            return
+
+        self.items.update(items_by_key)
+        rows_changed = False
+        for item_key, item in items_by_key.items():
+            row = self.item_to_row(item)
+            if item_key not in self.table.rows:
+                self.table.add_row(*row, key=item_key)
+                rows_changed = True
+                continue
+
+            # Rows that are already displayed (such as ones loaded from the cache) are updated in place, and only in the
+            # cells that actually changed, rather than being removed and added again
+            for column_key, current_value, new_value in zip(self.table.columns, self.table.get_row(item_key), row):
+                if current_value != new_value:
+                    self.table.update_cell(item_key, column_key, new_value, update_width=True)
+                    rows_changed = True
+
+        if rows_changed:
+            self.schedule_sort()
 
         if write_to_cache:
-            self.save_to_cache()
+            self.schedule_save_to_cache()
+
+    def move_item_to(self, other: "SearchableDataTable[T]", item: T) -> None:
+        """Moves a single item out of this table and into another one"""
+        item_key = self.item_to_key(item)
+        self.items.pop(item_key, None)
+        if item_key in self.table.rows:
+            self.table.remove_row(item_key)
+        other.add_items([item])
+
+    def bulk_transfer_from(self, other: "SearchableDataTable[T]") -> None:
+        """Moves every item out of another table and into this one, leaving the other table empty"""
+        transferred = list(other.items.values())
+        other.items = {}
+        other.table.clear()
+        self.add_items(transferred)
 
     @on(Input.Submitted)
     async def handle_submitted_search(self) -> None:
@@ -190,6 +261,7 @@ class LazilyLoadedDataTable(SearchableDataTable[T], Generic[T]):
         item_to_key: Callable[[T], str],
         *args,
         load_more_data_buffer: int = 5,
+        prefetch_next_batch: bool = False,
         reverse_sort: bool = False,
         cache_name: str | None = None,
         repo_based_cache: bool = True,
@@ -212,41 +284,95 @@ class LazilyLoadedDataTable(SearchableDataTable[T], Generic[T]):
         self.batch_size = batch_size
         self.load_more_data_buffer = load_more_data_buffer
         self.current_batch = 0
+        self._load_more_timer: Timer | None = None
+
+        # When enabled, the next batch is requested as soon as the current one has loaded so it's ready ahead of time
+        self.prefetch_next_batch = prefetch_next_batch
+        self._prefetched_batches: dict[int, Task[list[T]]] = {}
+        # Items can go stale between being fetched and being shown (e.g. a notification being read in the meantime), so
+        # anything this rejects is dropped from a batch right before it's added to the table
+        self.item_filter: Callable[[T], bool] | None = None
 
         # We initialize this to true and set it to false later if we believe we've run out of data to load from the load
         # function.
         self.can_load_more = True
 
     def change_load_function(self, new_load_function: TablePopulationFunction | None) -> None:
+        self.cancel_prefetched_batches()
         self.load_function = new_load_function
 
     def clear_rows(self):
         """Removes all rows currently displayed and tracked in this table"""
         super().clear_rows()
+        self.cancel_prefetched_batches()
+        self.cancel_pending_load()
         self.current_batch = 0
         self.can_load_more = True
         self.load_function = None
 
+    def cancel_prefetched_batches(self) -> None:
+        """Cancels any batches that were requested ahead of time but haven't been used yet"""
+        for prefetched_batch in self._prefetched_batches.values():
+            prefetched_batch.cancel()
+        self._prefetched_batches = {}
+
+    def cancel_pending_load(self) -> None:
+        """Cancels a load that was waiting for the cursor to settle"""
+        if self._load_more_timer is not None:
+            self._load_more_timer.stop()
+            self._load_more_timer = None
+
+    async def _fetch_batch(self, load_function: TablePopulationFunction, batch_to_fetch: int) -> list[T]:
+        if prefetched_batch := self._prefetched_batches.pop(batch_to_fetch, None):
+            return await prefetched_batch
+        return await load_function(self.batch_size, batch_to_fetch)
+
+    def _prefetch_batch(self, load_function: TablePopulationFunction, batch_to_fetch: int) -> None:
+        async def _load() -> list[T]:
+            return await load_function(self.batch_size, batch_to_fetch)
+
+        self._prefetched_batches[batch_to_fetch] = create_task(_load())
+
     @work
-    async def load_more_data(self, row_highlighted: DataTable.RowHighlighted) -> None:
+    async def load_more_data(self) -> None:
+        self._load_more_timer = None
         async with self.fetch_lock:
-            rows_remaining = len(self.items) - row_highlighted.cursor_row
+            rows_remaining = len(self.items) - self.table.cursor_row
             if not (self.can_load_more and self.load_function):
                 return
 
             if rows_remaining > self.load_more_data_buffer:
                 return
 
-            additional_data = await self.load_function(self.batch_size, self.current_batch + 1)
+            load_function = self.load_function
+            additional_data = await self._fetch_batch(load_function, self.current_batch + 1)
             self.current_batch += 1
             if len(additional_data) == 0:
                 self.can_load_more = False
+            elif self.prefetch_next_batch and len(additional_data) >= self.batch_size:
+                # A short batch means we've likely reached the end, so there's no point asking for another one early
+                self._prefetch_batch(load_function, self.current_batch + 1)
 
+            if self.item_filter is not None:
+                additional_data = [item for item in additional_data if self.item_filter(item)]
             self.add_items(additional_data)
 
+    def on_unmount(self) -> None:
+        self.cancel_prefetched_batches()
+        self.cancel_pending_load()
+
     @on(DataTable.RowHighlighted)
-    async def check_highlighted_row_boundary(self, row_highlighted: DataTable.RowHighlighted) -> None:
-        self.load_more_data(row_highlighted)
+    def check_highlighted_row_boundary(self, row_highlighted: DataTable.RowHighlighted) -> None:
+        # Don't stack up more requests while we're still waiting on the previous one
+        if not (self.can_load_more and self.load_function) or self.fetch_lock.locked():
+            return
+
+        if len(self.items) - row_highlighted.cursor_row > self.load_more_data_buffer:
+            return
+
+        # Moving quickly through the table restarts the timer, so we only load once the cursor has settled
+        self.cancel_pending_load()
+        self._load_more_timer = self.set_timer(LOAD_MORE_DEBOUNCE_SECONDS, self.load_more_data)
 
 
 class LazyGithubContainer(Container):
@@ -3,7 +3,6 @@ from typing import Dict
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer, VerticalScroll
-from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Label, Markdown, Rule, TabPane
 from textual.widgets.data_table import CellDoesNotExist
 
@@ -11,7 +10,7 @@ from lazy_github.lib.bindings import LazyGithubBindings
 from lazy_github.lib.context import LazyGithubContext
 from lazy_github.lib.github.issues import get_comments, list_issues
 from lazy_github.lib.logging import lg
-from lazy_github.lib.messages import IssuesAndPullRequestsFetched, IssueSelected, NewCommentCreated
+from lazy_github.lib.messages import IssueSelected, NewCommentCreated
 from lazy_github.models.github import Issue, IssueState, PartialPullRequest, Repository
 from lazy_github.ui.screens.edit_issue import EditIssueModal
 from lazy_github.ui.screens.new_comment import NewCommentModal
@@ -27,13 +26,10 @@ class IssuesContainer(LazyGithubContainer):
     BINDINGS = [LazyGithubBindings.EDIT_ISSUE]
 
     issues: Dict[int, Issue] = {}
-    status_column_index = -1
-    number_column_index = -1
-    title_column_index = -1
 
-    def compose(self) -> ComposeResult:
-        self.border_title = "[3] Issues"
-        yield LazilyLoadedDataTable(
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._table = LazilyLoadedDataTable(
             id="searchable_issues_table",
             table_id="issues_table",
             search_input_id="issues_search",
@@ -46,6 +42,10 @@ class IssuesContainer(LazyGithubContainer):
             reverse_sort=True,
         )
 
+    def compose(self) -> ComposeResult:
+        self.border_title = "[3] Issues"
+        yield self._table
+
     async def fetch_more_issues(self, batch_size: int, batch_to_fetch: int) -> list[Issue]:
         if not LazyGithubContext.current_repo:
             return []
@@ -62,11 +62,11 @@ class IssuesContainer(LazyGithubContainer):
 
     @property
     def searchable_table(self) -> LazilyLoadedDataTable[Issue]:
-        return self.query_one("#searchable_issues_table", LazilyLoadedDataTable)
+        return self._table
 
     @property
     def table(self) -> DataTable:
-        return self.query_one("#issues_table", DataTable)
+        return self._table.table
 
     def on_mount(self) -> None:
         self.table.cursor_type = "row"
@@ -75,25 +75,17 @@ class IssuesContainer(LazyGithubContainer):
         self.table.add_column("Author", key="author")
         self.table.add_column("Title", key="title")
 
-        self.status_column_index = self.table.get_column_index("status")
-        self.number_column_index = self.table.get_column_index("number")
-        self.title_column_index = self.table.get_column_index("title")
-
     def load_cached_issues_for_repo(self, repo: Repository) -> None:
         self.searchable_table.initialize_from_cache(repo, Issue)
 
-    async def on_issues_and_pull_requests_fetched(self, message: IssuesAndPullRequestsFetched) -> None:
-        message.stop()
-
-        self.searchable_table.add_items(message.issues)
+    def set_issues(self, issues: list[Issue]) -> None:
+        self.searchable_table.add_items(issues)
         self.searchable_table.change_load_function(self.fetch_more_issues)
         self.searchable_table.can_load_more = True
         self.searchable_table.current_batch = 1
 
     async def get_selected_issue(self) -> Issue:
-        pr_number_coord = Coordinate(self.table.cursor_row, self.number_column_index)
-        number = self.table.get_cell_at(pr_number_coord)
-        return self.searchable_table.items[str(number)]
+        return self.searchable_table.get_selected_item()
 
     @work
     async def trigger_edit_issue_flow(self) -> None:
@@ -152,6 +144,7 @@ class IssueConversationTabPane(TabPane):
     def __init__(self, issue: Issue) -> None:
         super().__init__("Comments", id="issue_conversation")
         self.issue = issue
+        self._comments_requested = False
 
     @property
     def comments(self) -> VerticalScroll:
@@ -173,9 +166,12 @@ class IssueConversationTabPane(TabPane):
     async def action_new_comment(self) -> None:
         self.new_comment_flow()
 
-    def on_mount(self) -> None:
-        self.loading = True
-        self.fetch_issue_comments()
+    def on_show(self) -> None:
+        # Comments aren't fetched until the tab is opened for the first time
+        if not self._comments_requested:
+            self._comments_requested = True
+            self.loading = True
+            self.fetch_issue_comments()
 
     @work
     async def fetch_issue_comments(self) -> None:
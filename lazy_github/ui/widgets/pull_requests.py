@@ -1,8 +1,14 @@
+import asyncio
+from contextlib import aclosing
+from functools import partial
+from typing import Hashable
+
 from httpx import HTTPStatusError
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer, VerticalScroll
-from textual.coordinate import Coordinate
+from textual.timer import Timer
 from textual.widgets import Collapsible, DataTable, Label, ListItem, ListView, Markdown, RichLog, Rule, TabPane
 
 from lazy_github.lib.bindings import LazyGithubBindings
@@ -13,12 +19,14 @@ from lazy_github.lib.github.checks import combined_check_status_for_ref
 from lazy_github.lib.github.issues import get_comments, list_issues
 from lazy_github.lib.github.pull_requests import (
     get_diff,
+    get_full_pull_request,
     get_reviews,
     merge_pull_request,
     reconstruct_review_conversation_hierarchy,
+    stream_diff,
 )
 from lazy_github.lib.logging import lg
-from lazy_github.lib.messages import IssuesAndPullRequestsFetched, PullRequestSelected
+from lazy_github.lib.messages import PullRequestSelected
 from lazy_github.models.github import (
     CheckStatus,
     CheckStatusState,
@@ -35,6 +43,30 @@ from lazy_github.ui.widgets.common import (
 )
 from lazy_github.ui.widgets.conversations import IssueCommentContainer, ReviewContainer
 
+# Large diffs are written to the log in chunks of this many lines so that highlighting them doesn't block the UI
+_DIFF_LINES_PER_WRITE = 200
+
+# Every line written to the diff log is highlighted and kept in memory, so past this point we stop and link to Github
+_MAX_DIFF_LINES = 5000
+
+# Highlighting is a good share of the cost of writing a large diff, so the highlighted text for the handful of most
+# recently viewed diffs is kept around for when those PRs are opened again. Keyed by the PR and its head/base commits.
+_HIGHLIGHTED_DIFF_CACHE_SIZE = 8
+_HIGHLIGHTED_DIFFS: dict[Hashable, list[Text]] = {}
+
+# How long a PR has to stay highlighted before we start fetching its details in anticipation of it being selected
+_PR_PREFETCH_DELAY = 0.2
+
+# Diffs are only prefetched for PRs with at most this many changed lines, so that scrolling past a huge PR doesn't
+# download a diff that may never be looked at
+_MAX_PREFETCHED_DIFF_CHANGES = 1000
+
+
+def _cache_highlighted_diff(key: Hashable, highlighted_chunks: list[Text]) -> None:
+    _HIGHLIGHTED_DIFFS[key] = highlighted_chunks
+    if len(_HIGHLIGHTED_DIFFS) > _HIGHLIGHTED_DIFF_CACHE_SIZE:
+        del _HIGHLIGHTED_DIFFS[next(iter(_HIGHLIGHTED_DIFFS))]
+
 
 def pull_request_to_cell(pr: PartialPullRequest) -> TableRow:
     return (pr.number, str(pr.state), pr.user.login, pr.title)
@@ -49,9 +81,6 @@ class PullRequestsContainer(LazyGithubContainer):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.status_column_index = -1
-        self.number_column_index = -1
-        self.title_column_index = -1
         self._table = LazilyLoadedDataTable(
             id="searchable_prs",
             table_id="pull_requests_table",
@@ -64,6 +93,7 @@ class PullRequestsContainer(LazyGithubContainer):
             cache_name="pull_requests",
             reverse_sort=True,
         )
+        self._prefetch_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         self.border_title = "[2] Pull Requests"
@@ -97,7 +127,7 @@ class PullRequestsContainer(LazyGithubContainer):
 
     @property
     def searchable_table(self) -> LazilyLoadedDataTable[PartialPullRequest]:
-        return self.query_one("#searchable_prs", LazilyLoadedDataTable)
+        return self._table
 
     @property
     def table(self) -> DataTable:
@@ -110,22 +140,35 @@ class PullRequestsContainer(LazyGithubContainer):
         self.table.add_column("Author", key="author")
         self.table.add_column("Title", key="title")
 
-        self.status_column_index = self.table.get_column_index("status")
-        self.number_column_index = self.table.get_column_index("number")
-        self.title_column_index = self.table.get_column_index("title")
-
-    async def on_issues_and_pull_requests_fetched(self, message: IssuesAndPullRequestsFetched) -> None:
-        message.stop()
-
-        self.searchable_table.add_items(message.pull_requests)
+    def set_pull_requests(self, pull_requests: list[PartialPullRequest]) -> None:
+        self.searchable_table.add_items(pull_requests)
         self.searchable_table.change_load_function(self.fetch_more_pull_requests)
         self.searchable_table.can_load_more = True
         self.searchable_table.current_batch = 1
 
     async def get_selected_pr(self) -> PartialPullRequest:
-        pr_number_coord = Coordinate(self.table.cursor_row, self.number_column_index)
-        number = self.table.get_cell_at(pr_number_coord)
-        return self.searchable_table.items[str(number)]
+        return self.searchable_table.get_selected_item()
+
+    @work(exclusive=True, group="prefetch_pull_request")
+    async def prefetch_pull_request(self, pr: PartialPullRequest) -> None:
+        """Fetches the full PR (and smaller diffs) ahead of time so they're already cached by the time it's selected"""
+        try:
+            full_pr = await get_full_pull_request(pr.repo, pr.number, pr.updated_at)
+            if full_pr.additions + full_pr.deletions <= _MAX_PREFETCHED_DIFF_CHANGES:
+                await get_diff(full_pr)
+        except Exception:
+            # If this fails, then it will fail again (and be reported) when the PR is actually selected
+            lg.debug(f"Failed to prefetch PR #{pr.number}")
+
+    @on(DataTable.RowHighlighted, "#pull_requests_table")
+    def pr_highlighted(self, highlighted: DataTable.RowHighlighted) -> None:
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        # Rows are also highlighted as the table is populated, which doesn't say anything about what the user wants
+        if not self.table.has_focus:
+            return
+        if pr := self.searchable_table.items.get(str(highlighted.row_key.value)):
+            self._prefetch_timer = self.set_timer(_PR_PREFETCH_DELAY, partial(self.prefetch_pull_request, pr))
 
     @on(DataTable.RowSelected, "#pull_requests_table")
     async def pr_selected(self) -> None:
@@ -185,7 +228,7 @@ class PrOverviewTabPane(TabPane):
                 )
 
                 # This will force refetch the updated information about the PR for the UI
-                self.post_message(PullRequestSelected(self.pr))
+                self.post_message(PullRequestSelected(self.pr, force=True))
             else:
                 lg.warning(f"Failed to merge PR {self.pr.number} in repo {self.pr.repo.full_name}")
                 self.notify(
@@ -224,13 +267,14 @@ class PrOverviewTabPane(TabPane):
         else:
             merge_status = "[frame green]Open[/frame green]"
 
-        with ScrollableContainer():
-            yield Label(f"{merge_status} [b]{self.pr.title}[b] {pr_link} by {user_link}")
-            yield Label(change_summary)
+        # The header is static, so it's rendered as a single label rather than a widget per line
+        header_lines = [f"{merge_status} [b]{self.pr.title}[/b] {pr_link} by {user_link}", change_summary]
+        if self.pr.merged_at:
+            date = self.pr.merged_at.strftime("%c")
+            header_lines.append(f"\nMerged on {date}")
 
-            if self.pr.merged_at:
-                date = self.pr.merged_at.strftime("%c")
-                yield Label(f"\nMerged on {date}")
+        with ScrollableContainer():
+            yield Label("\n".join(header_lines))
             yield Rule()
 
             # This is where we'll store information about the status checks being run on the PR
@@ -266,28 +310,72 @@ class PrDiffTabPane(TabPane):
     def __init__(self, pr: FullPullRequest) -> None:
         super().__init__("Diff", id="diff_pane")
         self.pr = pr
+        self._diff_requested = False
+        self._highlighted_chunks: list[Text] = []
 
     def compose(self) -> ComposeResult:
         with ScrollableContainer():
             yield RichLog(id="diff_contents", highlight=True)
 
+    async def write_chunk(self, diff_contents: RichLog, chunk: Text) -> None:
+        """Writes an already highlighted chunk of the diff to the log and then yields to the event loop"""
+        self._highlighted_chunks.append(chunk)
+        diff_contents.write(chunk)
+        # Show the start of the diff as soon as it's available rather than waiting on the whole thing
+        self.loading = False
+        await asyncio.sleep(0)
+
+    async def write_diff_lines(self, diff_contents: RichLog, diff_lines: list[str]) -> None:
+        """Highlights the lines and writes them to the log a chunk at a time"""
+        for start in range(0, len(diff_lines), _DIFF_LINES_PER_WRITE):
+            chunk = diff_contents.highlighter(Text("\n".join(diff_lines[start : start + _DIFF_LINES_PER_WRITE])))
+            await self.write_chunk(diff_contents, chunk)
+
     @work
     async def fetch_diff(self) -> None:
         diff_contents = self.query_one("#diff_contents", RichLog)
+        cache_key = (self.pr.id, self.pr.head.sha, self.pr.base.sha)
+        if (highlighted_chunks := _HIGHLIGHTED_DIFFS.get(cache_key)) is not None:
+            for chunk in highlighted_chunks:
+                await self.write_chunk(diff_contents, chunk)
+            self.loading = False
+            return
+
+        # The diff arrives in arbitrarily sized pieces, so hold back any trailing partial line until the rest of it does
+        partial_line = ""
+        lines_remaining = _MAX_DIFF_LINES
         try:
-            diff = await get_diff(self.pr)
+            # Closed explicitly so that giving up on a diff that's too large also stops downloading the rest of it
+            async with aclosing(stream_diff(self.pr)) as diff_chunks:
+                async for chunk in diff_chunks:
+                    *diff_lines, partial_line = (partial_line + chunk).split("\n")
+                    if len(diff_lines) > lines_remaining:
+                        await self.write_diff_lines(diff_contents, diff_lines[:lines_remaining])
+                        truncation_notice = (
+                            f"Diff truncated after {_MAX_DIFF_LINES} lines, see {self.pr.html_url}/files"
+                        )
+                        await self.write_chunk(diff_contents, Text(truncation_notice, style="bold yellow"))
+                        partial_line = ""
+                        break
+                    await self.write_diff_lines(diff_contents, diff_lines)
+                    lines_remaining -= len(diff_lines)
         except HTTPStatusError as hse:
             if hse.response.status_code == 404:
                 diff_contents.write("No diff contents found")
             else:
                 raise
         else:
-            diff_contents.write(diff)
+            if partial_line:
+                await self.write_diff_lines(diff_contents, [partial_line])
+            _cache_highlighted_diff(cache_key, self._highlighted_chunks)
         self.loading = False
 
-    async def on_mount(self) -> None:
-        self.loading = True
-        _ = self.fetch_diff()
+    def on_show(self) -> None:
+        # Diffs can be large, so we wait until someone actually opens the tab before fetching them
+        if not self._diff_requested:
+            self._diff_requested = True
+            self.loading = True
+            self.fetch_diff()
 
 
 class PrConversationTabPane(TabPane):
@@ -296,6 +384,7 @@ class PrConversationTabPane(TabPane):
     def __init__(self, pr: FullPullRequest) -> None:
         super().__init__("Conversation", id="conversation_pane")
         self.pr = pr
+        self._conversation_requested = False
 
     def compose(self) -> ComposeResult:
         yield VerticalScroll(id="pr_comments_and_reviews")
@@ -306,9 +395,9 @@ class PrConversationTabPane(TabPane):
 
     @work
     async def fetch_conversation(self) -> None:
-        reviews = await get_reviews(self.pr)
+        # The reviews and comments are independent of each other, so there's no need to wait on one before the other
+        reviews, comments = await asyncio.gather(get_reviews(self.pr), get_comments(self.pr))
         review_hierarchy = reconstruct_review_conversation_hierarchy(reviews)
-        comments = await get_comments(self.pr)
         self.comments_and_reviews.remove_children()
 
         handled_comment_node_ids: list[int] = []
@@ -328,9 +417,11 @@ class PrConversationTabPane(TabPane):
 
         self.loading = False
 
-    def on_mount(self) -> None:
-        self.loading = True
-        self.fetch_conversation()
+    def on_show(self) -> None:
+        if not self._conversation_requested:
+            self._conversation_requested = True
+            self.loading = True
+            self.fetch_conversation()
 
     @work
     async def action_new_comment(self) -> None:
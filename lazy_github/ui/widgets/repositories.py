@@ -2,7 +2,6 @@ import asyncio
 
 from textual import on, work
 from textual.app import ComposeResult
-from textual.coordinate import Coordinate
 from textual.widgets import DataTable
 
 import lazy_github.lib.github.repositories as repos_api
@@ -27,15 +26,11 @@ class ReposContainer(LazyGithubContainer):
     BINDINGS = [
         LazyGithubBindings.TOGGLE_FAVORITE_REPO,
         LazyGithubBindings.LOOKUP_REPOSITORY,
+        LazyGithubBindings.REFRESH_REPOSITORY,
     ]
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.favorite_column_index = -1
-        self.owner_column_index = 1
-        self.name_column_index = 1
-        self.private_column_index = 1
-
         self._table = SearchableDataTable(
             id="searchable_repos_table",
             table_id="repos_table",
@@ -53,7 +48,7 @@ class ReposContainer(LazyGithubContainer):
 
     @property
     def searchable_table(self) -> SearchableDataTable[Repository]:
-        return self.query_one("#searchable_repos_table", SearchableDataTable)
+        return self._table
 
     @property
     def table(self) -> DataTable:
@@ -67,19 +62,10 @@ class ReposContainer(LazyGithubContainer):
         self.table.add_column("Name", key="name")
         self.table.add_column("Private", key="private")
 
-        self.favorite_column_index = self.table.get_column_index("favorite")
-        self.owner_column_index = self.table.get_column_index("owner")
-        self.name_column_index = self.table.get_column_index("name")
-        self.private_column_index = self.table.get_column_index("private")
-
         self.load_repos()
 
     async def get_selected_repo(self) -> Repository:
-        current_row = self.table.cursor_row
-        owner = self.table.get_cell_at(Coordinate(current_row, self.owner_column_index))
-        repo_name = self.table.get_cell_at(Coordinate(current_row, self.name_column_index))
-        full_name = f"{owner}/{repo_name}"
-        return self.searchable_table.items[full_name]
+        return self.searchable_table.get_selected_item()
 
     @work
     async def action_lookup_repository(self) -> None:
@@ -137,6 +123,10 @@ class ReposContainer(LazyGithubContainer):
         self.table.update_cell(repo.full_name, "favorite", favorite_string(updated_favorited))
         self.searchable_table.sort_table()
 
+    async def action_refresh_repository(self) -> None:
+        repo = await self.get_selected_repo()
+        self.post_message(RepoSelected(repo, force=True))
+
     @on(DataTable.RowSelected, "#repos_table")
     async def repo_selected(self):
         # Bubble a message up indicating that a repo was selected
@@ -1,9 +1,9 @@
+import asyncio
 from functools import partial
 
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container
-from textual.coordinate import Coordinate
 from textual.widgets import DataTable, TabbedContent, TabPane
 
 from lazy_github.lib.bindings import LazyGithubBindings
@@ -26,8 +26,9 @@ class AvailableWorkflowsContainers(Container):
     BINDINGS = [LazyGithubBindings.TRIGGER_WORKFLOW]
     workflows: dict[str, Workflow] = {}
 
-    def compose(self) -> ComposeResult:
-        yield LazilyLoadedDataTable(
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._table = LazilyLoadedDataTable(
             id="searchable_workflows_table",
             table_id="workflows_table",
             search_input_id="workflows_search",
@@ -40,13 +41,16 @@ class AvailableWorkflowsContainers(Container):
             reverse_sort=True,
         )
 
+    def compose(self) -> ComposeResult:
+        yield self._table
+
     @property
     def searchable_table(self) -> LazilyLoadedDataTable[Workflow]:
-        return self.query_one("#searchable_workflows_table", LazilyLoadedDataTable)
+        return self._table
 
     @property
     def table(self) -> DataTable:
-        return self.query_one("#workflows_table", DataTable)
+        return self._table.table
 
     def on_mount(self) -> None:
         self.table.cursor_type = "row"
@@ -55,8 +59,6 @@ class AvailableWorkflowsContainers(Container):
         self.table.add_column("Updated", key="updated")
         self.table.add_column("Path", key="path")
 
-        self.path_column_id = self.table.get_column_index("path")
-
     def load_cached_workflows(self, repo: Repository) -> None:
         self.searchable_table.initialize_from_cache(repo, Workflow)
 
@@ -73,8 +75,7 @@ class AvailableWorkflowsContainers(Container):
         self.searchable_table.current_batch = 1
 
     def get_selected_workflow(self) -> Workflow:
-        workflow_path_coord = Coordinate(self.table.cursor_row, self.path_column_id)
-        return self.searchable_table.items[self.table.get_cell_at(workflow_path_coord)]
+        return self.searchable_table.get_selected_item()
 
     @work
     async def action_trigger_workflow(self) -> None:
@@ -85,8 +86,9 @@ class AvailableWorkflowsContainers(Container):
 
 
 class WorkflowRunsContainer(Container):
-    def compose(self) -> ComposeResult:
-        yield LazilyLoadedDataTable(
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._table = LazilyLoadedDataTable(
             id="searchable_workflow_runs_table",
             table_id="workflow_runs_table",
             search_input_id="workflow_runs_search",
@@ -99,13 +101,16 @@ class WorkflowRunsContainer(Container):
             reverse_sort=True,
         )
 
+    def compose(self) -> ComposeResult:
+        yield self._table
+
     @property
     def searchable_table(self) -> LazilyLoadedDataTable[WorkflowRun]:
-        return self.query_one("#searchable_workflow_runs_table", LazilyLoadedDataTable)
+        return self._table
 
     @property
     def table(self) -> DataTable:
-        return self.query_one("#workflow_runs_table", DataTable)
+        return self._table.table
 
     def on_mount(self) -> None:
         self.table.cursor_type = "row"
@@ -133,9 +138,13 @@ class WorkflowRunsContainer(Container):
 
 
 class WorkflowsContainer(LazyGithubContainer):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.tabs = TabbedContent(id="workflow_tabs")
+
     def compose(self) -> ComposeResult:
         self.border_title = "[4] Workflows"
-        with TabbedContent(id="workflow_tabs"):
+        with self.tabs:
             with TabPane("Runs", id="runs_tab"):
                 yield WorkflowRunsContainer(id="workflow_runs")
             with TabPane("Workflows", id="workflows_tab"):
@@ -153,7 +162,6 @@ class WorkflowsContainer(LazyGithubContainer):
         self.workflows.load_cached_workflows(repo)
         self.workflow_runs.load_cached_workflow_runs(repo)
 
-    @work
+    @work(exclusive=True, group="load_workflows")
     async def load_repo(self, repo: Repository) -> None:
-        await self.workflows.load_repo(repo)
-        await self.workflow_runs.load_repo(repo)
+        await asyncio.gather(self.workflows.load_repo(repo), self.workflow_runs.load_repo(repo))